@@ -0,0 +1,302 @@
+"""Benchmark a GamerPower update cycle against a local stub API.
+
+Starts an aiohttp stub of the GamerPower ``/giveaways``, ``/filter``,
+``/worth`` and ``/giveaway`` endpoints serving synthetic catalogues, then
+drives ``GamerPowerCoordinator._async_update_data``, the coordinator
+listeners and every sensor's ``extra_state_attributes`` for a number of
+cycles per catalogue size. Breakdown sensors are enabled, so the cycle
+includes adding the per-platform and per-type sensors and their attributes,
+and the recorder is reported as loaded, so it includes the hourly statistics
+import; ``async_add_external_statistics`` is replaced by a counter, which
+leaves the recorder's own database writes out of the measurement.
+
+For each size it reports the median and worst latency of a cycle, the peak
+traced memory, the number of allocated blocks, the serialized size of the
+sensor attributes and the number of statistics imported, separately for cycles where the catalogue changed
+(``changed``) and cycles answered with ``304 Not Modified`` (``unchanged``).
+Latencies are measured with ``tracemalloc`` enabled, so compare them between
+runs rather than against production timings.
+
+Usage, from the repository root with Home Assistant installed::
+
+    python benchmarks/bench_update_cycle.py
+    python benchmarks/bench_update_cycle.py --sizes 100 1000 --cycles 20
+    python benchmarks/bench_update_cycle.py --platforms steam --types game
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+
+from custom_components.gamerpower import hub as hub_module  # noqa: E402
+from custom_components.gamerpower.const import (  # noqa: E402
+    GIVEAWAY_TYPE_LABELS,
+    PLATFORMS,
+)
+from custom_components.gamerpower.coordinator import GamerPowerCoordinator  # noqa: E402
+from custom_components.gamerpower.hub import GamerPowerHub  # noqa: E402
+from custom_components.gamerpower.sensor import (  # noqa: E402
+    GamerPowerActiveGiveawaysListSensor,
+    GamerPowerLatestGiveawaySensor,
+    GamerPowerTotalGiveawaysSensor,
+    GamerPowerTotalWorthSensor,
+    _async_track_group_sensors,
+)
+
+DEFAULT_SIZES = [100, 1000, 5000, 20000]
+# Share of the catalogue replaced on every "changed" cycle
+CHURN = 0.02
+
+
+def make_giveaway(giveaway_id: int, rng: random.Random) -> dict[str, Any]:
+    """Return a synthetic giveaway shaped like the API payload."""
+    platforms = rng.sample(list(PLATFORMS.values()), rng.randint(1, 3))
+    worth = rng.choice(["N/A", f"${rng.uniform(0.99, 69.99):.2f}"])
+    return {
+        "id": giveaway_id,
+        "title": f"Synthetic Giveaway {giveaway_id}",
+        "worth": worth,
+        "thumbnail": f"https://example.invalid/{giveaway_id}-thumb.jpg",
+        "image": f"https://example.invalid/{giveaway_id}-image.jpg",
+        "description": "<p>" + "Lorem ipsum dolor sit amet. " * 20 + "</p>",
+        "instructions": "1. Click the button<br>2. Claim the key<br>" * 3,
+        "open_giveaway_url": f"https://example.invalid/open/{giveaway_id}",
+        "published_date": "2026-01-01 10:00:00",
+        "type": rng.choice(list(GIVEAWAY_TYPE_LABELS.values())),
+        "platforms": ", ".join(platforms),
+        "end_date": rng.choice(["N/A", "2026-12-31 23:59:00"]),
+        "users": rng.randint(0, 100000),
+        "status": "Active",
+        "gamerpower_url": f"https://example.invalid/{giveaway_id}",
+        "open_giveaway": f"https://example.invalid/open/{giveaway_id}",
+    }
+
+
+class StubApi:
+    """Serve a synthetic catalogue with ETag support."""
+
+    def __init__(self, size: int, seed: int = 0) -> None:
+        """Initialize the catalogue."""
+        self.rng = random.Random(seed)
+        self.next_id = 1
+        self.giveaways = [self._new() for _ in range(size)]
+        self._encode()
+
+    def _new(self) -> dict[str, Any]:
+        giveaway = make_giveaway(self.next_id, self.rng)
+        self.next_id += 1
+        return giveaway
+
+    def _encode(self) -> None:
+        self.body = json.dumps(self.giveaways).encode()
+        self.etag = f'"{hashlib.md5(self.body).hexdigest()}"'  # noqa: S324
+
+    def churn(self) -> None:
+        """Replace a share of the catalogue with new giveaways."""
+        for _ in range(max(1, int(len(self.giveaways) * CHURN))):
+            self.giveaways.pop(self.rng.randrange(len(self.giveaways)))
+            self.giveaways.insert(0, self._new())
+        self._encode()
+
+    async def giveaways_handler(self, request: web.Request) -> web.Response:
+        """Serve /giveaways and /filter."""
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304)
+        return web.Response(
+            body=self.body, content_type="application/json", headers={"ETag": self.etag}
+        )
+
+    async def worth_handler(self, request: web.Request) -> web.Response:
+        """Serve /worth."""
+        return web.json_response(
+            {"active_giveaways_number": len(self.giveaways), "worth_estimation_usd": "0"}
+        )
+
+    async def giveaway_handler(self, request: web.Request) -> web.Response:
+        """Serve /giveaway?id=."""
+        giveaway_id = int(request.query.get("id", 0))
+        for giveaway in self.giveaways:
+            if giveaway["id"] == giveaway_id:
+                return web.json_response(giveaway)
+        return web.json_response({"status": 0}, status=404)
+
+    def app(self) -> web.Application:
+        """Return the stub application."""
+        app = web.Application()
+        app.router.add_get("/api/giveaways", self.giveaways_handler)
+        app.router.add_get("/api/filter", self.giveaways_handler)
+        app.router.add_get("/api/worth", self.worth_handler)
+        app.router.add_get("/api/giveaway", self.giveaway_handler)
+        return app
+
+
+@dataclass
+class CycleStats:
+    """Measurements of one kind of cycle."""
+
+    latencies: list[float] = field(default_factory=list)
+    peaks: list[int] = field(default_factory=list)
+    blocks: list[int] = field(default_factory=list)
+    attribute_bytes: list[int] = field(default_factory=list)
+    imports: list[int] = field(default_factory=list)
+
+    def row(self, size: int, kind: str) -> str:
+        """Format the stats as a table row."""
+        if not self.latencies:
+            return f"{size:>7} {kind:>9}  (no cycles)"
+        return (
+            f"{size:>7} {kind:>9} "
+            f"{statistics.median(self.latencies) * 1000:>10.2f} "
+            f"{max(self.latencies) * 1000:>10.2f} "
+            f"{max(self.peaks) / 1024:>10.0f} "
+            f"{statistics.median(self.blocks):>10.0f} "
+            f"{statistics.median(self.attribute_bytes) / 1024:>10.1f} "
+            f"{statistics.median(self.imports):>10.0f}"
+        )
+
+
+async def run_size(
+    hass: HomeAssistant, size: int, cycles: int, platforms: list[str], types: list[str]
+) -> tuple[CycleStats, CycleStats]:
+    """Benchmark one catalogue size."""
+    api = StubApi(size)
+    runner = web.AppRunner(api.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+    hub_module.API_BASE_URL = f"http://127.0.0.1:{port}/api"
+
+    entry = SimpleNamespace(
+        entry_id=f"bench_{size}",
+        title=f"Bench {size}",
+        data={},
+        options={},
+        async_on_unload=lambda _unsub: None,
+    )
+    coordinator = GamerPowerCoordinator(
+        hass,
+        entry,
+        GamerPowerHub(hass),
+        platforms=platforms,
+        giveaway_types=types,
+        update_interval=30,
+        breakdown_sensors=True,
+    )
+    # Always go to the (stub) network
+    coordinator.update_interval = timedelta(0)
+    sensors = [
+        cls(coordinator, entry)
+        for cls in (
+            GamerPowerTotalGiveawaysSensor,
+            GamerPowerTotalWorthSensor,
+            GamerPowerLatestGiveawaySensor,
+            GamerPowerActiveGiveawaysListSensor,
+        )
+    ]
+    # Breakdown sensors are added by the coordinator listener, as in the platform
+    _async_track_group_sensors(hass, coordinator, entry, sensors.extend)
+
+    imports = 0
+
+    def count_import(*_args: Any) -> None:
+        nonlocal imports
+        imports += 1
+
+    statistics_sink = patch(
+        "homeassistant.components.recorder.statistics.async_add_external_statistics",
+        count_import,
+    )
+
+    changed, unchanged = CycleStats(), CycleStats()
+    statistics_sink.start()
+    try:
+        for cycle in range(cycles):
+            is_changed = cycle == 0 or cycle % 2 == 1
+            if cycle and is_changed:
+                api.churn()
+
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            imports = 0
+            start = time.perf_counter()
+            data = await coordinator._async_update_data()  # noqa: SLF001
+            if data is not coordinator.data:
+                coordinator.data = data
+                coordinator.async_update_listeners()
+            attributes = [sensor.extra_state_attributes for sensor in sensors]
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            stats = changed if is_changed else unchanged
+            stats.latencies.append(elapsed)
+            stats.peaks.append(peak)
+            stats.blocks.append(
+                sum(max(diff.count_diff, 0) for diff in after.compare_to(before, "filename"))
+            )
+            stats.attribute_bytes.append(sum(len(json_bytes(attrs)) for attrs in attributes))
+            stats.imports.append(imports)
+    finally:
+        statistics_sink.stop()
+        await runner.cleanup()
+    return changed, unchanged
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Statistics are only imported while the recorder is loaded
+        hass.config.components.add("recorder")
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        try:
+            print(
+                f"{'size':>7} {'cycle':>9} {'p50 ms':>10} {'max ms':>10} "
+                f"{'peak KiB':>10} {'blocks':>10} {'attr KiB':>10} {'imports':>10}"
+            )
+            for size in args.sizes:
+                changed, unchanged = await run_size(
+                    hass, size, args.cycles, args.platforms, args.types
+                )
+                print(changed.row(size, "changed"))
+                print(unchanged.row(size, "unchanged"))
+        finally:
+            await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--platforms", nargs="*", default=[], choices=list(PLATFORMS))
+    parser.add_argument("--types", nargs="*", default=[], choices=list(GIVEAWAY_TYPE_LABELS))
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"))
+    asyncio.run(main(parser.parse_args()))
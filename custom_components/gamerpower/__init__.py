@@ -1,28 +1,40 @@
 """The GamerPower integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
+import shutil
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
-import voluptuous as vol
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_BREAKDOWN_SENSORS,
+    CONF_MAX_LIST_ITEMS,
     CONF_PLATFORMS,
     CONF_SCAN_INTERVAL,
     CONF_TYPES,
+    DATA_HUB,
+    DEFAULT_MAX_LIST_ITEMS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    STORAGE_VERSION,
     VERSION,
 )
-from .coordinator import GamerPowerCoordinator
+from .services import async_setup_services
+
+if TYPE_CHECKING:
+    from .coordinator import GamerPowerCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.IMAGE, Platform.SENSOR]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -30,37 +42,31 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the GamerPower component."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
     _LOGGER.info("Initializing GamerPower integration version %s", VERSION)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up GamerPower from a config entry."""
-    # Get configuration with options override
-    platforms = entry.options.get(
-        CONF_PLATFORMS, entry.data.get(CONF_PLATFORMS, [])
-    )
-    giveaway_types = entry.options.get(
-        CONF_TYPES, entry.data.get(CONF_TYPES, [])
-    )
-    scan_interval = entry.options.get(
-        CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    )
-
-    # Create coordinator
+    """Set up GamerPower from a config entry.
+
+    Setup never waits for the network: entities start from the persisted
+    snapshot, or unavailable, while the first refresh runs in the background.
+    """
+    started = time.perf_counter()
+    # The coordinator, hub and their caches are imported on first entry setup
+    # pylint: disable=import-outside-toplevel
+    from .coordinator import GamerPowerCoordinator
+    from .hub import async_get_hub
+
+    imported = time.perf_counter()
     coordinator = GamerPowerCoordinator(
-        hass,
-        platforms=platforms,
-        giveaway_types=giveaway_types,
-        update_interval=scan_interval,
+        hass, entry, async_get_hub(hass), **_entry_options(entry)
+    )
+    await coordinator.async_restore()
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN}_refresh_{entry.entry_id}"
     )
-
-    # Fetch initial data
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:  # noqa: BLE001
-        _LOGGER.error("Error setting up GamerPower: %s", err)
-        raise ConfigEntryNotReady from err
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -69,10 +75,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_update_options))
+    entry.async_on_unload(coordinator.async_shutdown)
 
-    # Register services
-    await async_setup_services(hass, coordinator)
-
+    duration = time.perf_counter() - started
+    # Only the first entry set up pays for the imports
+    coordinator.metrics.record("import", imported - started)
+    coordinator.metrics.record("setup_entry", duration)
+    _LOGGER.debug("GamerPower entry %s set up in %.1f ms", entry.title, duration * 1000)
     return True
 
 
@@ -80,50 +89,47 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        # Drop the shared hub once the last entry is gone
+        if hass.data[DOMAIN].keys() <= {DATA_HUB} and (
+            hub := hass.data[DOMAIN].pop(DATA_HUB, None)
+        ):
+            await hub.async_close()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot, artwork and statistics of a deleted entry."""
+    # pylint: disable=import-outside-toplevel
+    from .coordinator import storage_key
+    from .images import image_cache_dir
+    from .statistics import async_clear_statistics
+
+    await Store(hass, STORAGE_VERSION, storage_key(entry.entry_id)).async_remove()
+    images = image_cache_dir(hass, entry.entry_id)
+    await hass.async_add_executor_job(partial(shutil.rmtree, images, ignore_errors=True))
+    await async_clear_statistics(hass, entry.entry_id)
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
-
-
-async def async_setup_services(
-    hass: HomeAssistant, coordinator: GamerPowerCoordinator
-) -> None:
-    """Set up services for GamerPower."""
-
-    async def handle_refresh(call: ServiceCall) -> None:
-        """Handle the refresh service call."""
-        _LOGGER.info("Manually refreshing GamerPower data")
-        await coordinator.async_request_refresh()
-
-    async def handle_get_giveaway(call: ServiceCall) -> dict:
-        """Handle getting a specific giveaway."""
-        giveaway_id = call.data.get("giveaway_id")
-        if giveaway_id:
-            result = await coordinator.async_get_giveaway_details(giveaway_id)
-            if result:
-                return result
-        return {}
-
-    # Register services if not already registered
-    if not hass.services.has_service(DOMAIN, "refresh"):
-        hass.services.async_register(
-            DOMAIN,
-            "refresh",
-            handle_refresh,
-            schema=vol.Schema({}),
-        )
-
-    if not hass.services.has_service(DOMAIN, "get_giveaway"):
-        hass.services.async_register(
-            DOMAIN,
-            "get_giveaway",
-            handle_get_giveaway,
-            schema=vol.Schema(
-                {
-                    vol.Required("giveaway_id"): cv.positive_int,
-                }
-            ),
-        )
+    """Apply updated options to the running coordinator, without a reload."""
+    coordinator: GamerPowerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_apply_options(**_entry_options(entry))
+
+
+def _entry_options(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the coordinator settings of an entry, options overriding data."""
+    return {
+        "platforms": entry.options.get(
+            CONF_PLATFORMS, entry.data.get(CONF_PLATFORMS, [])
+        ),
+        "giveaway_types": entry.options.get(
+            CONF_TYPES, entry.data.get(CONF_TYPES, [])
+        ),
+        "update_interval": entry.options.get(
+            CONF_SCAN_INTERVAL,
+            entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        ),
+        "max_list_items": entry.options.get(CONF_MAX_LIST_ITEMS, DEFAULT_MAX_LIST_ITEMS),
+        "adaptive_polling": entry.options.get(CONF_ADAPTIVE_POLLING, False),
+        "breakdown_sensors": entry.options.get(CONF_BREAKDOWN_SENSORS, False),
+    }
@@ -0,0 +1,353 @@
+"""SQLite archive of every giveaway the integration has seen."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import hashlib
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import GROUP_NONE, GROUP_PLATFORM, GROUP_TYPE
+from .models import Giveaway
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS giveaways (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    worth REAL,
+    type TEXT NOT NULL,
+    platforms TEXT NOT NULL,
+    status TEXT,
+    published_date INTEGER,
+    end_date INTEGER,
+    gamerpower_url TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    removed_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_giveaways_type ON giveaways (type);
+CREATE INDEX IF NOT EXISTS ix_giveaways_published ON giveaways (published_date);
+CREATE INDEX IF NOT EXISTS ix_giveaways_end ON giveaways (end_date);
+CREATE TABLE IF NOT EXISTS giveaway_platforms (
+    giveaway_id INTEGER NOT NULL REFERENCES giveaways (id) ON DELETE CASCADE,
+    platform TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (giveaway_id, platform)
+);
+CREATE INDEX IF NOT EXISTS ix_platforms_platform ON giveaway_platforms (platform);
+CREATE TABLE IF NOT EXISTS revisions (
+    giveaway_id INTEGER NOT NULL REFERENCES giveaways (id) ON DELETE CASCADE,
+    digest TEXT NOT NULL,
+    recorded_at INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    worth REAL,
+    status TEXT,
+    end_date INTEGER,
+    PRIMARY KEY (giveaway_id, digest)
+);
+CREATE INDEX IF NOT EXISTS ix_revisions_recorded ON revisions (recorded_at);
+"""
+
+# (giveaways to upsert, IDs no longer listed)
+Batch = tuple[list[Giveaway], list[int]]
+
+
+def _timestamp(value: datetime | None) -> int | None:
+    """Return a date as a Unix timestamp."""
+    return int(value.timestamp()) if value else None
+
+
+def _revision_digest(giveaway: Giveaway) -> str:
+    """Return a digest of the archived fields, to skip identical revisions."""
+    values = (
+        giveaway.title,
+        giveaway.worth,
+        giveaway.status,
+        _timestamp(giveaway.end_date),
+    )
+    return hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
+
+
+class GiveawayArchive:
+    """Append-only history of giveaways, written in batches from the executor.
+
+    Records are queued from the event loop and flushed together after
+    ``flush_delay`` seconds in a single transaction. Every distinct state of a
+    giveaway is kept as a revision; ``compact`` drops revisions older than the
+    retention period and reclaims the freed space.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        flush_delay: float,
+        compact_interval: timedelta,
+        revision_retention: timedelta,
+    ) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.path = path
+        self.flush_delay = flush_delay
+        self.revision_retention = revision_retention
+        self._connection: sqlite3.Connection | None = None
+        # Executor jobs may run on different threads
+        self._db_lock = threading.Lock()
+        self._pending: dict[int, Giveaway] = {}
+        self._pending_removed: set[int] = set()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._unsub_compact: CALLBACK_TYPE | None = async_track_time_interval(
+            hass, self._async_compact, compact_interval
+        )
+        self._unsub_final_write: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+        self.written = 0
+
+    @callback
+    def async_record(
+        self, giveaways: Iterable[Giveaway], removed: Iterable[int] = ()
+    ) -> None:
+        """Queue giveaways seen in an update and the IDs no longer listed."""
+        for giveaway in giveaways:
+            self._pending[giveaway.id] = giveaway
+            self._pending_removed.discard(giveaway.id)
+        self._pending_removed.update(removed)
+        if (self._pending or self._pending_removed) and self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.flush_delay, self._async_flush
+            )
+
+    async def _async_flush(self, _now: datetime | None = None) -> None:
+        """Write the queued records in one executor job."""
+        self._unsub_flush = None
+        if not self._pending and not self._pending_removed:
+            return
+        batch: Batch = (list(self._pending.values()), list(self._pending_removed))
+        self._pending = {}
+        self._pending_removed = set()
+        try:
+            await self.hass.async_add_executor_job(self._write, batch)
+        except sqlite3.Error as err:
+            _LOGGER.error("Error writing the giveaway archive: %s", err)
+            return
+        self.written += len(batch[0])
+
+    async def _async_final_write(self, _event: Event) -> None:
+        """Flush the queue before Home Assistant stops."""
+        self._unsub_final_write = None
+        await self.async_close()
+
+    async def _async_compact(self, _now: datetime) -> None:
+        """Compact the archive periodically."""
+        try:
+            await self.hass.async_add_executor_job(self.compact)
+        except sqlite3.Error as err:
+            _LOGGER.error("Error compacting the giveaway archive: %s", err)
+
+    async def async_close(self) -> None:
+        """Flush pending records and close the database."""
+        for unsub in (self._unsub_compact, self._unsub_final_write, self._unsub_flush):
+            if unsub is not None:
+                unsub()
+        self._unsub_compact = self._unsub_final_write = self._unsub_flush = None
+        await self._async_flush()
+        await self.hass.async_add_executor_job(self._close)
+
+    async def async_query(self, **criteria: Any) -> dict[str, Any]:
+        """Aggregate archived giveaways; see ``query``."""
+        try:
+            return await self.hass.async_add_executor_job(
+                lambda: self.query(**criteria)
+            )
+        except sqlite3.Error as err:
+            raise HomeAssistantError(
+                f"Error querying the giveaway archive: {err}"
+            ) from err
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection, creating the database on first use."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            # Only takes effect on a new database, before the tables exist
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _close(self) -> None:
+        """Close the connection."""
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _write(self, batch: Batch) -> None:
+        """Upsert a batch of giveaways and their revisions in one transaction."""
+        giveaways, removed = batch
+        now = int(time.time())
+        with self._db_lock, self._connect() as connection:
+            connection.executemany(
+                """
+                INSERT INTO giveaways (
+                    id, title, worth, type, platforms, status, published_date,
+                    end_date, gamerpower_url, first_seen, last_seen, removed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+                ON CONFLICT (id) DO UPDATE SET
+                    title = excluded.title,
+                    worth = excluded.worth,
+                    type = excluded.type,
+                    platforms = excluded.platforms,
+                    status = excluded.status,
+                    published_date = excluded.published_date,
+                    end_date = excluded.end_date,
+                    gamerpower_url = excluded.gamerpower_url,
+                    last_seen = excluded.last_seen,
+                    removed_at = NULL
+                """,
+                [
+                    (
+                        g.id,
+                        g.title,
+                        g.worth,
+                        g.type,
+                        g.platforms_text,
+                        g.status,
+                        _timestamp(g.published_date),
+                        _timestamp(g.end_date),
+                        g.gamerpower_url,
+                        now,
+                        now,
+                    )
+                    for g in giveaways
+                ],
+            )
+            connection.executemany(
+                "DELETE FROM giveaway_platforms WHERE giveaway_id = ?",
+                [(g.id,) for g in giveaways],
+            )
+            connection.executemany(
+                "INSERT INTO giveaway_platforms VALUES (?, ?)",
+                [(g.id, platform) for g in giveaways for platform in g.platforms],
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO revisions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        g.id,
+                        _revision_digest(g),
+                        now,
+                        g.title,
+                        g.worth,
+                        g.status,
+                        _timestamp(g.end_date),
+                    )
+                    for g in giveaways
+                ],
+            )
+            connection.executemany(
+                "UPDATE giveaways SET removed_at = ? WHERE id = ? AND removed_at IS NULL",
+                [(now, giveaway_id) for giveaway_id in removed],
+            )
+
+    def compact(self) -> None:
+        """Drop expired revisions and reclaim the freed pages."""
+        cutoff = int(time.time() - self.revision_retention.total_seconds())
+        with self._db_lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "DELETE FROM revisions WHERE recorded_at < ?", (cutoff,)
+                )
+            connection.execute("PRAGMA incremental_vacuum")
+            connection.execute("PRAGMA optimize")
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def query(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        platforms: list[str] | None = None,
+        types: list[str] | None = None,
+        group_by: str = GROUP_NONE,
+    ) -> dict[str, Any]:
+        """Aggregate the archived giveaways published in ``[start, end)``.
+
+        ``platforms`` are platform labels and ``types`` type labels, each
+        matching any of their values. Returns the overall count and worth, and
+        the same aggregates per group.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if start is not None:
+            clauses.append("g.published_date >= ?")
+            params.append(_timestamp(start))
+        if end is not None:
+            clauses.append("g.published_date < ?")
+            params.append(_timestamp(end))
+        if types:
+            clauses.append(f"g.type IN ({', '.join('?' * len(types))})")
+            params.extend(types)
+        if platforms:
+            clauses.append(
+                "g.id IN (SELECT giveaway_id FROM giveaway_platforms"
+                f" WHERE platform IN ({', '.join('?' * len(platforms))}))"
+            )
+            params.extend(platforms)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._db_lock:
+            connection = self._connect()
+            count, worth = connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(g.worth), 0) FROM giveaways g {where}",  # noqa: S608
+                params,
+            ).fetchone()
+            groups: dict[str, dict[str, Any]] = {}
+            if group_by != GROUP_NONE:
+                if group_by == GROUP_PLATFORM:
+                    key = "p.platform"
+                    source = "giveaways g JOIN giveaway_platforms p ON p.giveaway_id = g.id"
+                elif group_by == GROUP_TYPE:
+                    key, source = "g.type", "giveaways g"
+                else:
+                    key = "strftime('%Y-%m', g.published_date, 'unixepoch')"
+                    source = "giveaways g"
+                for group, group_count, group_worth in connection.execute(
+                    f"SELECT {key}, COUNT(*), COALESCE(SUM(g.worth), 0)"  # noqa: S608
+                    f" FROM {source} {where} GROUP BY 1 ORDER BY 1",
+                    params,
+                ):
+                    groups[group or "unknown"] = {
+                        "count": group_count,
+                        "worth_usd": round(group_worth, 2),
+                    }
+
+        result: dict[str, Any] = {"count": count, "worth_usd": round(worth, 2)}
+        if group_by != GROUP_NONE:
+            result["groups"] = groups
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Return row counts and the file size for diagnostics."""
+        with self._db_lock:
+            connection = self._connect()
+            giveaways = connection.execute("SELECT COUNT(*) FROM giveaways").fetchone()[0]
+            revisions = connection.execute("SELECT COUNT(*) FROM revisions").fetchone()[0]
+        return {
+            "giveaways": giveaways,
+            "revisions": revisions,
+            "bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
@@ -0,0 +1,94 @@
+"""Giveaway detail cache for the GamerPower integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .models import Giveaway
+
+# Seeded entries are records from the list; fetched entries are API dicts
+CacheValue = Giveaway | dict[str, Any]
+
+
+class GiveawayDetailCache:
+    """Bounded LRU cache with TTL for ``/giveaway?id=`` lookups.
+
+    Entries are seeded from the list payload, which carries the same fields,
+    and dropped as soon as their giveaway leaves the catalogue. Concurrent
+    misses for one ID share a single in-flight request.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetch: Callable[[int], Awaitable[dict[str, Any] | None]],
+        max_size: int,
+        ttl: float,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._fetch = fetch
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, CacheValue]] = OrderedDict()
+        self._inflight: dict[int, asyncio.Task[CacheValue | None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @callback
+    def seed(self, giveaways: Iterable[Giveaway]) -> None:
+        """Replace the cache content with the giveaways of the latest catalogue.
+
+        Anything not listed any more, including details fetched on demand, is
+        invalidated.
+        """
+        expires = time.monotonic() + self.ttl
+        entries: OrderedDict[int, tuple[float, CacheValue]] = OrderedDict()
+        for giveaway in giveaways:
+            entries[giveaway.id] = (expires, giveaway)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+        self._entries = entries
+
+    @callback
+    def get(self, giveaway_id: int) -> CacheValue | None:
+        """Return a fresh cached entry without fetching it."""
+        if (entry := self._entries.get(giveaway_id)) is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[giveaway_id]
+            return None
+        self._entries.move_to_end(giveaway_id)
+        return entry[1]
+
+    async def async_get(self, giveaway_id: int) -> CacheValue | None:
+        """Return the details of a giveaway, fetching them on a miss."""
+        if (details := self.get(giveaway_id)) is not None:
+            self.hits += 1
+            return details
+        self.misses += 1
+
+        if (task := self._inflight.get(giveaway_id)) is None:
+            task = self.hass.async_create_task(self._async_fetch(giveaway_id))
+            self._inflight[giveaway_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(giveaway_id, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, giveaway_id: int) -> CacheValue | None:
+        """Fetch a giveaway and store it."""
+        details = await self._fetch(giveaway_id)
+        if details is not None:
+            self._entries[giveaway_id] = (time.monotonic() + self.ttl, details)
+            self._entries.move_to_end(giveaway_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return details
@@ -0,0 +1,118 @@
+"""Calendar platform for GamerPower integration."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import GamerPowerCoordinator
+from .entity import GamerPowerEntity
+from .models import GamerPowerData, Giveaway
+
+_LOGGER = logging.getLogger(__name__)
+
+# Length given to giveaways without a usable publication date
+DEFAULT_EVENT_DURATION = timedelta(hours=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the GamerPower calendar from a config entry."""
+    coordinator: GamerPowerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([GamerPowerDeadlinesCalendar(coordinator, entry)])
+
+
+def giveaway_event(giveaway: Giveaway) -> CalendarEvent | None:
+    """Return a giveaway as an event running until its end date."""
+    if (end := giveaway.end_date) is None:
+        return None
+    start = giveaway.published_date
+    if start is None or start >= end:
+        start = end - DEFAULT_EVENT_DURATION
+    return CalendarEvent(
+        start=start,
+        end=end,
+        summary=giveaway.title,
+        description=(
+            f"{giveaway.type} on {giveaway.platforms_text}, worth {giveaway.worth_text}"
+        ),
+        location=giveaway.open_giveaway_url,
+        uid=str(giveaway.id),
+    )
+
+
+class CalendarIndex:
+    """Giveaway events in two sorted arrays, by start and by end.
+
+    A range query bisects both arrays, takes the shorter of the two slices
+    (events ending after the range starts, or starting before it ends) and
+    checks the other bound on it.
+    """
+
+    def __init__(self, giveaways: list[Giveaway]) -> None:
+        """Build the arrays from a snapshot."""
+        events = [event for g in giveaways if (event := giveaway_event(g)) is not None]
+        self.by_start = sorted(events, key=lambda e: (e.start, e.end))
+        self.starts = [event.start for event in self.by_start]
+        self.by_end = sorted(events, key=lambda e: (e.end, e.start))
+        self.ends = [event.end for event in self.by_end]
+
+    def between(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return the events overlapping ``[start, end)``, by start date."""
+        ending_after = bisect_right(self.ends, start)
+        starting_before = bisect_left(self.starts, end)
+        if len(self.ends) - ending_after < starting_before:
+            events = [e for e in self.by_end[ending_after:] if e.start < end]
+            events.sort(key=lambda e: (e.start, e.end))
+            return events
+        return [e for e in self.by_start[:starting_before] if e.end > start]
+
+    def next_deadline(self, now: datetime) -> CalendarEvent | None:
+        """Return the running or upcoming event ending first."""
+        index = bisect_right(self.ends, now)
+        return self.by_end[index] if index < len(self.by_end) else None
+
+
+class GamerPowerDeadlinesCalendar(GamerPowerEntity, CalendarEntity):
+    """Calendar of giveaways running until their end date."""
+
+    _attr_icon = "mdi:calendar-clock"
+
+    def __init__(
+        self, coordinator: GamerPowerCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_deadlines"
+        self._attr_name = "Giveaway Deadlines"
+        self._index_generation: int | None = None
+        self._index = CalendarIndex([])
+
+    def _get_index(self) -> CalendarIndex:
+        """Return the index, rebuilt only when the snapshot changed."""
+        data: GamerPowerData | None = self.coordinator.data
+        if data is not None and data.generation != self._index_generation:
+            self._index = CalendarIndex(data.giveaways)
+            self._index_generation = data.generation
+        return self._index
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next giveaway deadline."""
+        return self._get_index().next_deadline(dt_util.utcnow())
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the giveaways running in a date range."""
+        return self._get_index().between(start_date, end_date)
@@ -1,6 +1,7 @@
 """Config flow for GamerPower integration."""
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -10,18 +11,20 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
-    API_BASE_URL,
-    API_ENDPOINT_GIVEAWAYS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BREAKDOWN_SENSORS,
+    CONF_MAX_LIST_ITEMS,
     CONF_PLATFORMS,
     CONF_SCAN_INTERVAL,
     CONF_TYPES,
+    DEFAULT_MAX_LIST_ITEMS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     GIVEAWAY_TYPES,
+    MAX_LIST_ITEMS,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     PLATFORMS,
@@ -42,45 +45,50 @@ class GamerPowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate API connection
+            # Generate unique_id based on selected platforms and types
+            platforms = sorted(user_input.get(CONF_PLATFORMS, []))
+            types = sorted(user_input.get(CONF_TYPES, []))
+            unique_id_parts = [DOMAIN]
+            if platforms:
+                unique_id_parts.append("_".join(platforms))
+            if types:
+                unique_id_parts.append("_".join(types))
+            unique_id = "_".join(unique_id_parts) if len(unique_id_parts) > 1 else f"{DOMAIN}_all"
+
+            await self.async_set_unique_id(unique_id)
+            self._abort_if_unique_id_configured()
+
+            # The hub is only imported once a flow reaches the network
+            # pylint: disable-next=import-outside-toplevel
+            from .hub import GamerPowerError, async_get_hub
+
+            # Validate API connection through the shared hub: the catalogue it
+            # downloads is reused by the new entry's first refresh
             try:
-                session = async_get_clientsession(self.hass)
-                async with session.get(
-                    f"{API_BASE_URL}{API_ENDPOINT_GIVEAWAYS}",
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    if response.status in (200, 201):
-                        # Generate unique_id based on selected platforms and types
-                        platforms = sorted(user_input.get(CONF_PLATFORMS, []))
-                        types = sorted(user_input.get(CONF_TYPES, []))
-                        unique_id_parts = [DOMAIN]
-                        if platforms:
-                            unique_id_parts.append("_".join(platforms))
-                        if types:
-                            unique_id_parts.append("_".join(types))
-                        unique_id = "_".join(unique_id_parts) if len(unique_id_parts) > 1 else f"{DOMAIN}_all"
-                        
-                        await self.async_set_unique_id(unique_id)
-                        self._abort_if_unique_id_configured()
-
-                        # Generate descriptive title
-                        title_parts = []
-                        if platforms:
-                            title_parts.append(", ".join(platforms))
-                        if types:
-                            title_parts.append(", ".join(types))
-                        title = f"GamerPower - {' / '.join(title_parts)}" if title_parts else "GamerPower - All Giveaways"
-
-                        return self.async_create_entry(
-                            title=title,
-                            data=user_input,
-                        )
-                    errors["base"] = "cannot_connect"
-            except aiohttp.ClientError:
+                await async_get_hub(self.hass).async_get_giveaways(
+                    timedelta(
+                        minutes=user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                    )
+                    / 2
+                )
+            except (aiohttp.ClientError, TimeoutError, GamerPowerError):
                 errors["base"] = "cannot_connect"
             except Exception:  # noqa: BLE001
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
+            else:
+                # Generate descriptive title
+                title_parts = []
+                if platforms:
+                    title_parts.append(", ".join(platforms))
+                if types:
+                    title_parts.append(", ".join(types))
+                title = f"GamerPower - {' / '.join(title_parts)}" if title_parts else "GamerPower - All Giveaways"
+
+                return self.async_create_entry(
+                    title=title,
+                    data=user_input,
+                )
 
         # Build form schema
         data_schema = vol.Schema(
@@ -140,6 +148,13 @@ class GamerPowerOptionsFlowHandler(config_entries.OptionsFlow):
         current_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, current_interval
         )
+        current_max_items = self.config_entry.options.get(
+            CONF_MAX_LIST_ITEMS, DEFAULT_MAX_LIST_ITEMS
+        )
+        current_adaptive = self.config_entry.options.get(CONF_ADAPTIVE_POLLING, False)
+        current_breakdown = self.config_entry.options.get(
+            CONF_BREAKDOWN_SENSORS, False
+        )
 
         data_schema = vol.Schema(
             {
@@ -155,6 +170,18 @@ class GamerPowerOptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                 ),
+                vol.Optional(
+                    CONF_MAX_LIST_ITEMS, default=current_max_items
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=1, max=MAX_LIST_ITEMS),
+                ),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING, default=current_adaptive
+                ): bool,
+                vol.Optional(
+                    CONF_BREAKDOWN_SENSORS, default=current_breakdown
+                ): bool,
             }
         )
 
@@ -15,11 +15,21 @@ API_ENDPOINT_WORTH: Final = "/worth"
 DEFAULT_SCAN_INTERVAL: Final = 30
 MIN_SCAN_INTERVAL: Final = 5
 MAX_SCAN_INTERVAL: Final = 1440  # 24 hours
+# Adaptive polling never relaxes beyond this multiple of the configured interval
+ADAPTIVE_MAX_FACTOR: Final = 4
 
 # Configuration keys
 CONF_PLATFORMS: Final = "platforms"
 CONF_TYPES: Final = "types"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_MAX_LIST_ITEMS: Final = "max_list_items"
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
+CONF_BREAKDOWN_SENSORS: Final = "breakdown_sensors"
+
+# Active giveaways list sensor attribute budget
+DEFAULT_MAX_LIST_ITEMS: Final = 50
+MAX_LIST_ITEMS: Final = 200
+MAX_LIST_ATTRIBUTE_BYTES: Final = 12288  # recorder drops attributes over 16 KiB
 
 # Available platforms
 PLATFORMS: Final = {
@@ -49,10 +59,81 @@ GIVEAWAY_TYPES: Final = {
     "beta": "Beta Access",
 }
 
+# Values of the "type" field returned by the API for each giveaway type
+GIVEAWAY_TYPE_LABELS: Final = {
+    "game": "Game",
+    "loot": "DLC",
+    "beta": "Early Access",
+}
+
+# hass.data[DOMAIN] key holding the shared fetch hub
+DATA_HUB: Final = "hub"
+
+# Retry and circuit breaker for API calls
+RETRY_ATTEMPTS: Final = 3
+RETRY_BASE_DELAY: Final = 2  # seconds
+RETRY_MAX_DELAY: Final = 30  # seconds
+CIRCUIT_FAILURE_THRESHOLD: Final = 3
+CIRCUIT_COOLDOWN: Final = 300  # seconds
+CIRCUIT_MAX_COOLDOWN: Final = 3600  # seconds
+
+# Giveaway artwork cache
+IMAGE_MAX_BYTES: Final = 5 * 1024 * 1024
+
+# Giveaway history archive
+ARCHIVE_FILE: Final = "gamerpower_archive.db"
+ARCHIVE_FLUSH_DELAY: Final = 10  # seconds
+ARCHIVE_COMPACT_INTERVAL: Final = 86400  # seconds
+ARCHIVE_REVISION_RETENTION: Final = 365  # days
+
+# Groupings of the query_archive service
+GROUP_NONE: Final = "none"
+GROUP_PLATFORM: Final = "platform"
+GROUP_TYPE: Final = "type"
+GROUP_MONTH: Final = "month"
+GROUP_OPTIONS: Final = [GROUP_NONE, GROUP_PLATFORM, GROUP_TYPE, GROUP_MONTH]
+
+# Long-term statistics of the platform and type breakdowns
+STATISTICS_MAX_GAP_HOURS: Final = 24  # hours filled between two updates
+
+# Giveaway detail cache
+DETAIL_CACHE_SIZE: Final = 1000
+DETAIL_CACHE_TTL: Final = 3600  # seconds
+DETAIL_FETCH_CONCURRENCY: Final = 5
+MAX_BATCH_GIVEAWAYS: Final = 100
+
+# Persistent warm-start snapshot
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10  # seconds
+
 # Sensor types
 SENSOR_TYPE_TOTAL_GIVEAWAYS: Final = "total_giveaways"
 SENSOR_TYPE_TOTAL_WORTH: Final = "total_worth"
 SENSOR_TYPE_LATEST_GIVEAWAY: Final = "latest_giveaway"
 
+# Events
+EVENT_NEW_GIVEAWAY: Final = "gamerpower_new_giveaway"
+EVENT_GIVEAWAY_UPDATED: Final = "gamerpower_giveaway_updated"
+EVENT_GIVEAWAY_EXPIRED: Final = "gamerpower_giveaway_expired"
+EVENT_GIVEAWAY_REMOVED: Final = "gamerpower_giveaway_removed"
+
+# Services
+SERVICE_REFRESH: Final = "refresh"
+SERVICE_GET_GIVEAWAY: Final = "get_giveaway"
+SERVICE_GET_GIVEAWAYS: Final = "get_giveaways"
+SERVICE_LIST_GIVEAWAYS: Final = "list_giveaways"
+SERVICE_SEARCH: Final = "search"
+SERVICE_QUERY_ARCHIVE: Final = "query_archive"
+
+# Sort orders of the search service
+SORT_NEWEST: Final = "newest"
+SORT_WORTH: Final = "worth"
+SORT_END_DATE: Final = "end_date"
+SORT_TITLE: Final = "title"
+SORT_OPTIONS: Final = [SORT_NEWEST, SORT_WORTH, SORT_END_DATE, SORT_TITLE]
+
+# Service field routing a call to one config entry
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+
 # Attribution
 ATTRIBUTION: Final = "Data provided by GamerPower.com"
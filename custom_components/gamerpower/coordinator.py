@@ -1,37 +1,70 @@
 """Data update coordinator for GamerPower."""
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    API_BASE_URL,
-    API_ENDPOINT_FILTER,
-    API_ENDPOINT_GIVEAWAYS,
-    API_ENDPOINT_WORTH,
-    ATTRIBUTION,
+    ADAPTIVE_MAX_FACTOR,
+    DEFAULT_MAX_LIST_ITEMS,
     DOMAIN,
+    EVENT_GIVEAWAY_EXPIRED,
+    EVENT_GIVEAWAY_REMOVED,
+    EVENT_GIVEAWAY_UPDATED,
+    EVENT_NEW_GIVEAWAY,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
+from .diff import Fingerprint, GiveawayChanges, diff_giveaways, fingerprint_all
+from .hub import (
+    GamerPowerCircuitOpenError,
+    GamerPowerError,
+    GamerPowerHub,
+    GamerPowerRateLimitedError,
+    filter_giveaways,
+)
+from .metrics import Metrics
+from .models import (
+    GamerPowerData,
+    Giveaway,
+    compact_giveaway,
+    parse_giveaways,
+    split_expired,
+)
+from .scheduler import AdaptiveScheduler
+from .search import GiveawayIndex
+from .statistics import GiveawayStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class GamerPowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class GamerPowerCoordinator(DataUpdateCoordinator[GamerPowerData]):
     """Coordinator to fetch data from GamerPower API."""
 
     def __init__(
         self,
         hass: HomeAssistant,
+        entry: ConfigEntry,
+        hub: GamerPowerHub,
         platforms: list[str],
         giveaway_types: list[str],
         update_interval: int,
+        max_list_items: int = DEFAULT_MAX_LIST_ITEMS,
+        adaptive_polling: bool = False,
+        breakdown_sensors: bool = False,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -39,118 +72,434 @@ class GamerPowerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(minutes=update_interval),
+            # Unchanged cycles return the previous data object; skip the writes
+            always_update=False,
         )
+        self.entry_id = entry.entry_id
+        self.hub = hub
         self.platforms = platforms
         self.giveaway_types = giveaway_types
-        self.session = async_get_clientsession(hass)
-        self._last_giveaway_ids: set[int] = set()
+        self.max_list_items = max_list_items
+        # Whether the sensor platform adds a sensor per platform and per type
+        self.breakdown_sensors = breakdown_sensors
+        self._fingerprints: dict[int, Fingerprint] = {}
+        self._hub_generation = -1
+        self._generation = 0
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, storage_key(entry.entry_id)
+        )
+        self._ids_changed = False
+        # True from a scheduled save until the Store asks for the snapshot
+        self._save_pending = False
+        # True while the data is the last good snapshot kept through failures
+        self.stale = False
+        self._unsub_expiry: CALLBACK_TYPE | None = None
+        self._expiry_at: datetime | None = None
+        self.metrics = Metrics()
+        self.index = GiveawayIndex()
+        self.statistics = GiveawayStatistics(hass, entry.entry_id, entry.title)
+        # Next snapshot is a new baseline: report no changes for it
+        self._rebaseline = False
+        # Next update downloads the catalogue even if the hub's copy is recent
+        self._force_download = False
+        self.scheduler = self._create_scheduler(update_interval, adaptive_polling)
+
+    @staticmethod
+    def _create_scheduler(
+        update_interval: int, adaptive_polling: bool
+    ) -> AdaptiveScheduler | None:
+        """Return the adaptive scheduler for the options, if enabled."""
+        if not adaptive_polling:
+            return None
+        return AdaptiveScheduler(
+            timedelta(minutes=update_interval),
+            timedelta(minutes=MIN_SCAN_INTERVAL),
+            min(
+                timedelta(minutes=update_interval * ADAPTIVE_MAX_FACTOR),
+                timedelta(minutes=MAX_SCAN_INTERVAL),
+            ),
+        )
+
+    async def async_apply_options(
+        self,
+        platforms: list[str],
+        giveaway_types: list[str],
+        update_interval: int,
+        max_list_items: int = DEFAULT_MAX_LIST_ITEMS,
+        adaptive_polling: bool = False,
+        breakdown_sensors: bool = False,
+    ) -> None:
+        """Apply changed options in place, without reloading the entry.
+
+        Interval changes only reschedule the next poll, and toggling the
+        breakdown sensors only notifies the listeners, which add or remove
+        them. Filter and list size changes rebuild the snapshot from the hub's
+        cached catalogue, which always holds every giveaway; the API is only
+        called when the hub has not downloaded the catalogue yet.
+        """
+        interval = timedelta(minutes=update_interval)
+        base_interval = (
+            self.scheduler.base if self.scheduler else self.update_interval
+        )
+        if interval != base_interval or adaptive_polling != (self.scheduler is not None):
+            self.scheduler = self._create_scheduler(update_interval, adaptive_polling)
+            self.update_interval = interval
+            self._unschedule_refresh()
+            self._schedule_refresh()
+
+        if breakdown_sensors != self.breakdown_sensors:
+            self.breakdown_sensors = breakdown_sensors
+            self.async_update_listeners()
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from GamerPower API."""
+        if (
+            platforms == self.platforms
+            and giveaway_types == self.giveaway_types
+            and max_list_items == self.max_list_items
+        ):
+            return
+        self.platforms = platforms
+        self.giveaway_types = giveaway_types
+        self.max_list_items = max_list_items
+        # Switching filters is not a change upstream: fire no events for it
+        self._rebaseline = True
+        self._hub_generation = -1
+
+        if not self.hub.has_catalogue:
+            await self.async_request_refresh()
+            return
+        giveaways, _ = split_expired(
+            filter_giveaways(self.hub.giveaways, platforms, giveaway_types),
+            dt_util.utcnow(),
+        )
+        self._rebaseline = False
+        self._hub_generation = self.hub.generation
+        self._fingerprints = fingerprint_all(giveaways)
+        self._archive(giveaways, GiveawayChanges())
+        self.async_set_updated_data(self._build_data(giveaways, GiveawayChanges()))
+        self.statistics.async_record(self.data, dt_util.utcnow())
+        self._schedule_expiry(self.data)
+        self._schedule_save()
+
+    async def async_restore(self) -> bool:
+        """Load the last persisted snapshot as the current data.
+
+        Returns True when a snapshot was restored, so setup does not need to
+        wait for the network before creating entities.
+        """
+        if not (stored := await self._store.async_load()):
+            return False
+        giveaways, texts = parse_giveaways(stored.get("giveaways", []))
+        for giveaway_id, text in texts.items():
+            self.hub.texts.setdefault(giveaway_id, text)
+        # Drop what ended while Home Assistant was stopped
+        giveaways, _ = split_expired(giveaways, dt_util.utcnow())
+        self._fingerprints = fingerprint_all(giveaways)
+        self.data = self._build_data(giveaways, GiveawayChanges())
+        self._schedule_expiry(self.data)
+        return True
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Persist the current data after a delay, coalescing close updates."""
+        self._save_pending = True
+        self._store.async_delay_save(self._snapshot, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to persist for the next startup."""
+        self._save_pending = False
+        return {
+            "giveaways": [
+                giveaway.as_dict(self.hub.texts.get(giveaway.id))
+                for giveaway in (self.data.giveaways if self.data else [])
+            ],
+        }
+
+    def _build_data(
+        self, giveaways: list[Giveaway], changes: GiveawayChanges
+    ) -> GamerPowerData:
+        """Build the next snapshot from a filtered giveaway list."""
+        self._generation += 1
+        with self.metrics.measure("index"):
+            self.index.sync(giveaways)
+        with self.metrics.measure("snapshot_build"):
+            return GamerPowerData.build(
+                self._generation, giveaways, changes, self.max_list_items
+            )
+
+    async def _async_update_data(self) -> GamerPowerData:
+        """Fetch data from GamerPower API.
+
+        When the API fails after retries, or while the hub's circuit breaker is
+        open, the last good snapshot is kept and flagged as stale instead of
+        making every entity unavailable.
+        """
+        self._ids_changed = False
         try:
-            data: dict[str, Any] = {
-                "giveaways": [],
-                "worth": {},
-                "new_giveaways": [],
-                "attribution": ATTRIBUTION,
-            }
-
-            # Fetch giveaways
-            giveaways = await self._fetch_giveaways()
-            data["giveaways"] = giveaways
-
-            # Detect new giveaways
-            current_ids = {g["id"] for g in giveaways}
-            if self._last_giveaway_ids:
-                new_ids = current_ids - self._last_giveaway_ids
-                data["new_giveaways"] = [
-                    g for g in giveaways if g["id"] in new_ids
-                ]
-            self._last_giveaway_ids = current_ids
-
-            # Fetch worth estimation
-            worth = await self._fetch_worth()
-            data["worth"] = worth
-
-            return data
-
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error communicating with GamerPower API: {err}") from err
+            with self.metrics.measure("update"):
+                data = await self._async_update_snapshot()
+            self.metrics.record_success()
+        except GamerPowerRateLimitedError as err:
+            self._reschedule_after_failure(err.retry_after)
+            return self._stale_or_raise(str(err), err)
+        except GamerPowerCircuitOpenError as err:
+            self._reschedule_after_failure(err.retry_in)
+            return self._stale_or_raise(str(err), err)
+        except (aiohttp.ClientError, GamerPowerError) as err:
+            self._reschedule_after_failure()
+            return self._stale_or_raise(
+                f"Error communicating with GamerPower API: {err}", err
+            )
         except TimeoutError as err:
-            raise UpdateFailed(f"Timeout fetching GamerPower data: {err}") from err
-
-    async def _fetch_giveaways(self) -> list[dict[str, Any]]:
-        """Fetch giveaways from API."""
-        if self.platforms or self.giveaway_types:
-            # Use filter endpoint for specific platforms/types
-            url = f"{API_BASE_URL}{API_ENDPOINT_FILTER}"
-            params = {}
-            
-            if self.platforms:
-                params["platform"] = ".".join(self.platforms)
-            if self.giveaway_types:
-                params["type"] = ".".join(self.giveaway_types)
-            
-            async with self.session.get(
-                url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 201:
-                    # No giveaways available
-                    return []
-                if response.status == 200:
-                    return await response.json()
-                _LOGGER.warning(
-                    "Unexpected status %s from GamerPower API", response.status
-                )
-                return []
-        else:
-            # Fetch all giveaways
-            url = f"{API_BASE_URL}{API_ENDPOINT_GIVEAWAYS}"
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 201:
-                    return []
-                if response.status == 200:
-                    return await response.json()
-                _LOGGER.warning(
-                    "Unexpected status %s from GamerPower API", response.status
-                )
-                return []
-
-    async def _fetch_worth(self) -> dict[str, Any]:
-        """Fetch total worth estimation from API."""
-        url = f"{API_BASE_URL}{API_ENDPOINT_WORTH}"
-        params = {}
-        
-        if self.platforms:
-            params["platform"] = self.platforms[0]  # API only accepts one platform
-        if self.giveaway_types:
-            params["type"] = self.giveaway_types[0]  # API only accepts one type
+            self._reschedule_after_failure()
+            return self._stale_or_raise(f"Timeout fetching GamerPower data: {err}", err)
+        finally:
+            async_dispatcher_send(self.hass, signal_metrics_updated(self.entry_id))
 
-        try:
-            async with self.session.get(
-                url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return {}
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Could not fetch worth data: %s", err)
-            return {}
+        self._set_stale(False, data)
+        self._schedule_expiry(data)
+        with self.metrics.measure("statistics"):
+            self.statistics.async_record(
+                data, dt_util.utcnow(), changed=data is not self.data
+            )
+        if self.scheduler:
+            self.update_interval = self.scheduler.record_success(
+                self._ids_changed, dt_util.utcnow()
+            )
+        return data
+
+    def _stale_or_raise(self, message: str, err: Exception) -> GamerPowerData:
+        """Return the last good snapshot marked stale, or fail the update."""
+        if self.data is None:
+            raise UpdateFailed(message) from err
+        _LOGGER.debug("Serving stale GamerPower data: %s", message)
+        self._set_stale(True, self.data)
+        return self.data
+
+    @callback
+    def _set_stale(self, stale: bool, data: GamerPowerData) -> None:
+        """Update the stale flag, notifying entities if the data is unchanged.
+
+        ``always_update=False`` skips listeners when the same snapshot is
+        returned, so a flip of the flag alone has to be pushed explicitly.
+        """
+        if stale == self.stale:
+            return
+        self.stale = stale
+        if data is self.data:
+            self.async_update_listeners()
+
+    async def async_force_refresh(self) -> None:
+        """Request a refresh that bypasses the hub's in-memory catalogue.
+
+        Scheduled polls accept a catalogue downloaded by another entry within
+        half an interval; a manual refresh always asks the API.
+        """
+        self._force_download = True
+        await self.async_request_refresh()
+
+    async def _async_update_snapshot(self) -> GamerPowerData:
+        """Return the next snapshot, or the current one if nothing changed."""
+        max_age = timedelta(0) if self._force_download else self.update_interval / 2
+        self._force_download = False
+        catalogue = await self.hub.async_get_giveaways(max_age)
+
+        # Nothing changed upstream: keep the current data untouched
+        if self.data is not None and self.hub.generation == self._hub_generation:
+            return self.data
+        self._hub_generation = self.hub.generation
+
+        # Filter the shared catalogue locally; the API can keep listing
+        # giveaways for a while after their end date
+        with self.metrics.measure("filter"):
+            giveaways, _ = split_expired(
+                filter_giveaways(catalogue, self.platforms, self.giveaway_types),
+                dt_util.utcnow(),
+            )
+
+        # Detect added, updated, expired and removed giveaways
+        with self.metrics.measure("diff"):
+            changes, self._fingerprints = diff_giveaways(self._fingerprints, giveaways)
+        baseline = self.data is None or self._rebaseline
+        if baseline:
+            # Nothing to compare the very first list (or a new filter) with
+            changes = GiveawayChanges()
+            self._rebaseline = False
+        elif not changes.has_changes and [g.id for g in giveaways] == [
+            g.id for g in self.data.giveaways
+        ]:
+            # Our filtered view is unchanged even though the catalogue changed
+            return self.data
+        self._ids_changed = changes.ids_changed
+
+        data = self._build_data(giveaways, changes)
+        self._schedule_save()
+        self._fire_change_events(changes)
+        self._archive(giveaways if baseline else None, changes)
+        return data
+
+    @callback
+    def _archive(
+        self, baseline: list[Giveaway] | None, changes: GiveawayChanges
+    ) -> None:
+        """Queue the giveaways of a new snapshot for the history archive.
+
+        A baseline list is archived as a whole; otherwise only what changed.
+        Expired giveaways are stored one last time and marked as removed, like
+        the giveaways no longer listed.
+        """
+        if baseline is not None:
+            self.hub.archive.async_record(baseline)
+            return
+        self.hub.archive.async_record(
+            [
+                *changes.added,
+                *(giveaway for giveaway, _ in changes.updated),
+                *changes.expired,
+            ],
+            [*changes.removed, *(giveaway.id for giveaway in changes.expired)],
+        )
+
+    @callback
+    def _schedule_expiry(self, data: GamerPowerData) -> None:
+        """Arm a single timer for the earliest end date in the snapshot."""
+        if data.next_expiry == self._expiry_at and (
+            self._unsub_expiry is not None or data.next_expiry is None
+        ):
+            return
+        self._cancel_expiry()
+        self._expiry_at = data.next_expiry
+        if data.next_expiry is not None:
+            self._unsub_expiry = async_track_point_in_utc_time(
+                self.hass, self._async_handle_expiry, data.next_expiry
+            )
+
+    @callback
+    def _cancel_expiry(self) -> None:
+        """Cancel the pending expiry timer."""
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        self._expiry_at = None
+
+    @callback
+    def _async_handle_expiry(self, now: datetime) -> None:
+        """Prune giveaways past their end date without polling the API.
+
+        The pruned giveaways are reported as expired, and the regular poll
+        schedule is left untouched.
+        """
+        self._unsub_expiry = None
+        self._expiry_at = None
+        if self.data is None:
+            return
+        giveaways, expired = split_expired(self.data.giveaways, now)
+        if expired:
+            for giveaway in expired:
+                self._fingerprints.pop(giveaway.id, None)
+            changes = GiveawayChanges(expired=expired)
+            self.data = self._build_data(giveaways, changes)
+            self._schedule_save()
+            self._fire_change_events(changes)
+            self._archive(None, changes)
+            self.statistics.async_record(self.data, now)
+            self.async_update_listeners()
+        self._schedule_expiry(self.data)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the expiry timer, flush a pending save and stop polling.
+
+        The delayed save would otherwise fire after the entry is unloaded and
+        could recreate the storage file that removing the entry deletes.
+        """
+        self._cancel_expiry()
+        if self._save_pending:
+            await self._store.async_save(self._snapshot())
+        await super().async_shutdown()
+
+    def _reschedule_after_failure(self, retry_after: float | None = None) -> None:
+        """Back off the next poll after a failed update.
+
+        With fixed polling the hub alone honours Retry-After: polls made while
+        it is blocked are served from memory.
+        """
+        self.metrics.record_failure()
+        if self.scheduler:
+            self.update_interval = self.scheduler.record_failure(retry_after)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the coordinator state and metrics for diagnostics."""
+        return {
+            "platforms": self.platforms,
+            "giveaway_types": self.giveaway_types,
+            "update_interval_s": self.update_interval.total_seconds()
+            if self.update_interval
+            else None,
+            "adaptive_polling": self.scheduler is not None,
+            "last_update_success": self.last_update_success,
+            "stale": self.stale,
+            "next_expiry": self._expiry_at.isoformat() if self._expiry_at else None,
+            "generation": self._generation,
+            "giveaways": len(self.data.giveaways) if self.data else None,
+            "tracked_fingerprints": len(self._fingerprints),
+            "indexed_giveaways": len(self.index),
+            "statistics_series": len(self.statistics),
+            "metrics": self.metrics.as_dict(),
+        }
+
+    @callback
+    def _fire_change_events(self, changes: GiveawayChanges) -> None:
+        """Fire one compact event per giveaway that changed in this cycle."""
+        batch_size = len(changes.added)
+        for index, giveaway in enumerate(changes.added):
+            self.hass.bus.async_fire(
+                EVENT_NEW_GIVEAWAY,
+                {
+                    **compact_giveaway(giveaway),
+                    "config_entry_id": self.entry_id,
+                    "batch_index": index,
+                    "batch_size": batch_size,
+                },
+            )
+        for giveaway, changed in changes.updated:
+            self.hass.bus.async_fire(
+                EVENT_GIVEAWAY_UPDATED,
+                {
+                    **compact_giveaway(giveaway),
+                    "config_entry_id": self.entry_id,
+                    "changes": {
+                        key: {"old": old, "new": new}
+                        for key, (old, new) in changed.items()
+                    },
+                },
+            )
+        for giveaway in changes.expired:
+            self.hass.bus.async_fire(
+                EVENT_GIVEAWAY_EXPIRED,
+                {**compact_giveaway(giveaway), "config_entry_id": self.entry_id},
+            )
+        for giveaway_id in changes.removed:
+            self.hass.bus.async_fire(
+                EVENT_GIVEAWAY_REMOVED,
+                {"id": giveaway_id, "config_entry_id": self.entry_id},
+            )
 
     async def async_get_giveaway_details(self, giveaway_id: int) -> dict[str, Any] | None:
         """Fetch details for a specific giveaway."""
-        url = f"{API_BASE_URL}/giveaway"
-        params = {"id": giveaway_id}
-        
-        try:
-            async with self.session.get(
-                url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.error("Error fetching giveaway %s: %s", giveaway_id, err)
-            return None
+        return await self.hub.async_get_giveaway_details(giveaway_id)
+
+    async def async_get_many_giveaway_details(
+        self, giveaway_ids: list[int]
+    ) -> tuple[dict[int, dict[str, Any]], dict[int, str]]:
+        """Fetch details for several giveaways concurrently."""
+        return await self.hub.async_get_many_giveaway_details(giveaway_ids)
+
+
+def signal_metrics_updated(entry_id: str) -> str:
+    """Return the dispatcher signal sent after every update attempt."""
+    return f"{DOMAIN}_metrics_updated_{entry_id}"
+
+
+def storage_key(entry_id: str) -> str:
+    """Return the storage key of the snapshot for a config entry."""
+    return f"{DOMAIN}.{entry_id}"
@@ -0,0 +1,92 @@
+"""Change detection between successive GamerPower giveaway lists."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import Giveaway
+
+# Fields whose changes are reported as updates
+TRACKED_FIELDS: tuple[str, ...] = (
+    "title",
+    "worth",
+    "type",
+    "platforms",
+    "end_date",
+    "status",
+    "open_giveaway_url",
+    "thumbnail",
+    "image",
+)
+
+STATUS_EXPIRED = "Expired"
+
+Fingerprint = tuple[Any, ...]
+
+
+def fingerprint(giveaway: Giveaway) -> Fingerprint:
+    """Return the tracked field values of a giveaway."""
+    return tuple(getattr(giveaway, key) for key in TRACKED_FIELDS)
+
+
+def fingerprint_all(giveaways: list[Giveaway]) -> dict[int, Fingerprint]:
+    """Return the fingerprint of every giveaway, keyed by ID."""
+    return {giveaway.id: fingerprint(giveaway) for giveaway in giveaways}
+
+
+@dataclass(frozen=True, slots=True)
+class GiveawayChanges:
+    """Precise delta between two giveaway lists."""
+
+    added: list[Giveaway] = field(default_factory=list)
+    # (giveaway, {field: (old, new)})
+    updated: list[tuple[Giveaway, dict[str, tuple[Any, Any]]]] = field(
+        default_factory=list
+    )
+    expired: list[Giveaway] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.updated or self.expired or self.removed)
+
+    @property
+    def ids_changed(self) -> bool:
+        """Return True if giveaways appeared or disappeared."""
+        return bool(self.added or self.removed)
+
+
+def diff_giveaways(
+    previous: dict[int, Fingerprint], giveaways: list[Giveaway]
+) -> tuple[GiveawayChanges, dict[int, Fingerprint]]:
+    """Compare a giveaway list with the previous fingerprints in one pass.
+
+    Returns the changes and the fingerprints to compare the next list with.
+    A giveaway whose status flips to "Expired" is reported as expired rather
+    than updated.
+    """
+    changes = GiveawayChanges()
+    current: dict[int, Fingerprint] = {}
+
+    for giveaway in giveaways:
+        giveaway_id = giveaway.id
+        new = current[giveaway_id] = fingerprint(giveaway)
+        if (old := previous.get(giveaway_id)) is None:
+            changes.added.append(giveaway)
+        elif old != new:
+            changed = {
+                key: (old_value, new_value)
+                for key, old_value, new_value in zip(TRACKED_FIELDS, old, new, strict=True)
+                if old_value != new_value
+            }
+            if "status" in changed and giveaway.status == STATUS_EXPIRED:
+                changes.expired.append(giveaway)
+            else:
+                changes.updated.append((giveaway, changed))
+
+    changes.removed.extend(
+        giveaway_id for giveaway_id in previous if giveaway_id not in current
+    )
+    return changes, current
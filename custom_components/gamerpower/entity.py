@@ -0,0 +1,39 @@
+"""Base entity for the GamerPower integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTRIBUTION, DOMAIN
+from .coordinator import GamerPowerCoordinator
+
+
+class GamerPowerEntity(CoordinatorEntity[GamerPowerCoordinator]):
+    """Entity of a GamerPower config entry, attached to its device."""
+
+    _attr_has_entity_name = True
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(
+        self, coordinator: GamerPowerCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._entry = entry
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name="GamerPower Giveaways",
+            manufacturer="GamerPower.com",
+            model="Game Giveaway Tracker",
+            configuration_url="https://www.gamerpower.com",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return False until the first snapshot is restored or downloaded."""
+        return super().available and self.coordinator.data is not None
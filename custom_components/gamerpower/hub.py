@@ -0,0 +1,407 @@
+"""Shared fetch hub for the GamerPower integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+import hashlib
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .cache import GiveawayDetailCache
+from .const import (
+    API_BASE_URL,
+    API_ENDPOINT_GIVEAWAY,
+    API_ENDPOINT_GIVEAWAYS,
+    ARCHIVE_COMPACT_INTERVAL,
+    ARCHIVE_FILE,
+    ARCHIVE_FLUSH_DELAY,
+    ARCHIVE_REVISION_RETENTION,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_COOLDOWN,
+    DATA_HUB,
+    DETAIL_CACHE_SIZE,
+    DETAIL_CACHE_TTL,
+    DETAIL_FETCH_CONCURRENCY,
+    DOMAIN,
+    GIVEAWAY_TYPE_LABELS,
+    PLATFORMS,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+from .metrics import Metrics
+from .models import Giveaway, parse_giveaways
+from .resilience import CircuitBreaker, async_retry
+
+if TYPE_CHECKING:
+    from .archive import GiveawayArchive
+
+_LOGGER = logging.getLogger(__name__)
+
+# Back-off used when a 429 response carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 300  # seconds
+
+# Errors retried with backoff before a call is considered failed
+TRANSIENT_ERRORS = (aiohttp.ClientError, TimeoutError)
+
+
+class GamerPowerError(HomeAssistantError):
+    """Base class for GamerPower API errors."""
+
+
+class GamerPowerApiError(GamerPowerError):
+    """Raised when the API answers with an unexpected status."""
+
+    def __init__(self, status: int) -> None:
+        """Initialize the error."""
+        super().__init__(f"Unexpected status {status} from GamerPower API")
+        self.status = status
+
+
+class GamerPowerServerError(GamerPowerApiError):
+    """Raised on 5xx responses, which are worth retrying."""
+
+
+class GamerPowerCircuitOpenError(GamerPowerError):
+    """Raised while the circuit breaker refuses API calls."""
+
+    def __init__(self, retry_in: float) -> None:
+        """Initialize the error."""
+        super().__init__(
+            "GamerPower API calls suspended after repeated failures, "
+            f"next try in {retry_in:.0f}s"
+        )
+        self.retry_in = retry_in
+
+
+class GamerPowerRateLimitedError(GamerPowerError):
+    """Raised when the API asks us to slow down."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialize the error."""
+        super().__init__(f"Rate limited by GamerPower API, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class GamerPowerHub:
+    """Download the full giveaway catalogue once and share it between entries.
+
+    Every config entry polls through the hub instead of calling the API on its
+    own. A download younger than the caller's ``max_age`` is served from memory,
+    and concurrent callers wait on the same in-flight request.
+
+    Requests are conditional (ETag / Last-Modified) and the body is hashed, so a
+    ``304`` or a byte-identical payload is never decoded again. ``generation``
+    only increases when the catalogue content actually changed.
+
+    The catalogue is kept as compact ``Giveaway`` records; the long HTML text
+    fields live in ``texts`` and are only joined back for detail lookups.
+
+    Transient failures are retried with jittered backoff, and a circuit breaker
+    suspends API calls after repeated failed downloads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.session = async_get_clientsession(hass)
+        self.giveaways: list[Giveaway] = []
+        self._by_id: dict[int, Giveaway] = {}
+        self.texts: dict[int, tuple[str, str]] = {}
+        self.generation = 0
+        self._fetched_at: float | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._digest: bytes | None = None
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._detail_semaphore = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+        self.metrics = Metrics()
+        self.circuit = CircuitBreaker(
+            CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN, CIRCUIT_MAX_COOLDOWN
+        )
+        self.details = GiveawayDetailCache(
+            hass, self._async_fetch_details, DETAIL_CACHE_SIZE, DETAIL_CACHE_TTL
+        )
+        self._archive: GiveawayArchive | None = None
+
+    @property
+    def archive(self) -> GiveawayArchive:
+        """Return the history archive, opening it on first use.
+
+        The archive pulls in sqlite3, so it is only imported once a refresh
+        or a service actually needs it.
+        """
+        if self._archive is None:
+            # pylint: disable-next=import-outside-toplevel
+            from .archive import GiveawayArchive
+
+            self._archive = GiveawayArchive(
+                self.hass,
+                Path(self.hass.config.path(ARCHIVE_FILE)),
+                ARCHIVE_FLUSH_DELAY,
+                timedelta(seconds=ARCHIVE_COMPACT_INTERVAL),
+                timedelta(days=ARCHIVE_REVISION_RETENTION),
+            )
+        return self._archive
+
+    async def async_close(self) -> None:
+        """Flush and close the archive once the last entry is unloaded."""
+        if self._archive is not None:
+            await self._archive.async_close()
+
+    def get(self, giveaway_id: int) -> Giveaway | None:
+        """Return a giveaway of the catalogue by ID."""
+        return self._by_id.get(giveaway_id)
+
+    @property
+    def has_catalogue(self) -> bool:
+        """Return True once the catalogue has been downloaded."""
+        return self._fetched_at is not None
+
+    async def async_get_giveaways(self, max_age: timedelta) -> list[Giveaway]:
+        """Return the full catalogue, downloading it if the copy is too old."""
+        async with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                # Honour Retry-After for every entry, not only the one that hit it
+                if self._fetched_at is None:
+                    raise GamerPowerRateLimitedError(self._blocked_until - now)
+                return self.giveaways
+            if self._fetched_at is None or (
+                now - self._fetched_at >= max_age.total_seconds()
+            ):
+                await self._async_fetch_with_retry()
+            return self.giveaways
+
+    async def _async_fetch_with_retry(self) -> None:
+        """Download the catalogue, retrying transient errors, behind the circuit."""
+        if self.circuit.is_open:
+            raise GamerPowerCircuitOpenError(self.circuit.retry_in)
+        try:
+            await async_retry(
+                self._async_fetch,
+                (*TRANSIENT_ERRORS, GamerPowerServerError),
+                RETRY_ATTEMPTS,
+                RETRY_BASE_DELAY,
+                RETRY_MAX_DELAY,
+            )
+        except GamerPowerRateLimitedError:
+            raise
+        except (*TRANSIENT_ERRORS, GamerPowerApiError):
+            self.circuit.record_failure()
+            if self.circuit.is_open:
+                _LOGGER.warning(
+                    "GamerPower API keeps failing, suspending calls for %.0fs",
+                    self.circuit.retry_in,
+                )
+            raise
+        self.circuit.record_success()
+
+    async def _async_fetch(self) -> None:
+        """Download the full catalogue from the API."""
+        url = f"{API_BASE_URL}{API_ENDPOINT_GIVEAWAYS}"
+        headers: dict[str, str] = {}
+        if self._etag:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        if self._last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+
+        with self.metrics.measure("fetch_giveaways"):
+            async with self.session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 429:
+                    self.metrics.record_response(response.status, None)
+                    retry_after = _parse_retry_after(
+                        response.headers.get(hdrs.RETRY_AFTER)
+                    )
+                    self._blocked_until = time.monotonic() + retry_after
+                    raise GamerPowerRateLimitedError(retry_after)
+                if response.status == 304:
+                    self.metrics.record_response(response.status, 0)
+                    self._fetched_at = time.monotonic()
+                    self.details.seed(self.giveaways)
+                    return
+                if response.status == 201:
+                    # No giveaways available
+                    body = b""
+                elif response.status == 200:
+                    body = await response.read()
+                else:
+                    self.metrics.record_response(response.status, None)
+                    if response.status >= 500:
+                        raise GamerPowerServerError(response.status)
+                    raise GamerPowerApiError(response.status)
+                self.metrics.record_response(response.status, len(body))
+                self._etag = response.headers.get(hdrs.ETAG)
+                self._last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+
+        self._fetched_at = time.monotonic()
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest != self._digest:
+            with self.metrics.measure("decode"):
+                self.giveaways, self.texts = parse_giveaways(
+                    json_loads(body) if body else []
+                )
+                self._by_id = {giveaway.id: giveaway for giveaway in self.giveaways}
+            self._digest = digest
+            self.generation += 1
+        self.details.seed(self.giveaways)
+
+    async def async_get_giveaway_details(self, giveaway_id: int) -> dict[str, Any] | None:
+        """Return details for a specific giveaway, from the cache when possible."""
+        try:
+            return self._as_details(await self.details.async_get(giveaway_id))
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error("Error fetching giveaway %s: %s", giveaway_id, err)
+            return None
+
+    async def async_get_many_giveaway_details(
+        self, giveaway_ids: list[int]
+    ) -> tuple[dict[int, dict[str, Any]], dict[int, str]]:
+        """Return details for several giveaways and the error of each failed ID.
+
+        Cache misses are fetched concurrently, bounded by a shared semaphore.
+        """
+        unique_ids = list(dict.fromkeys(giveaway_ids))
+        results = await asyncio.gather(
+            *(self.details.async_get(giveaway_id) for giveaway_id in unique_ids),
+            return_exceptions=True,
+        )
+
+        found: dict[int, dict[str, Any]] = {}
+        errors: dict[int, str] = {}
+        for giveaway_id, result in zip(unique_ids, results, strict=True):
+            if isinstance(result, Exception):
+                errors[giveaway_id] = str(result) or type(result).__name__
+            elif result is None:
+                errors[giveaway_id] = "not_found"
+            else:
+                found[giveaway_id] = self._as_details(result)
+        return found, errors
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the hub state and metrics for diagnostics."""
+        lookups = self.details.hits + self.details.misses
+        return {
+            "generation": self.generation,
+            "giveaways": len(self.giveaways),
+            "catalogue_age_s": (
+                round(time.monotonic() - self._fetched_at, 1)
+                if self._fetched_at is not None
+                else None
+            ),
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "rate_limited_for_s": round(max(self._blocked_until - time.monotonic(), 0), 1),
+            "circuit": {
+                "open": self.circuit.is_open,
+                "failures": self.circuit.failures,
+                "retry_in_s": round(self.circuit.retry_in, 1),
+            },
+            "detail_cache": {
+                "size": len(self.details),
+                "hits": self.details.hits,
+                "misses": self.details.misses,
+                "hit_rate": round(self.details.hits / lookups, 3) if lookups else None,
+            },
+            "metrics": self.metrics.as_dict(),
+        }
+
+    def _as_details(
+        self, value: Giveaway | dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Return a cached record as a full API giveaway dict."""
+        if isinstance(value, Giveaway):
+            return value.as_dict(self.texts.get(value.id))
+        return value
+
+    async def _async_fetch_details(self, giveaway_id: int) -> dict[str, Any] | None:
+        """Fetch details for a specific giveaway, retrying transient errors."""
+        if self.circuit.is_open:
+            raise GamerPowerCircuitOpenError(self.circuit.retry_in)
+
+        async def _async_request() -> dict[str, Any] | None:
+            url = f"{API_BASE_URL}{API_ENDPOINT_GIVEAWAY}"
+            async with self.session.get(
+                url, params={"id": giveaway_id}, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                if response.status >= 500:
+                    raise GamerPowerServerError(response.status)
+                return None
+
+        async with self._detail_semaphore:
+            return await async_retry(
+                _async_request,
+                (*TRANSIENT_ERRORS, GamerPowerServerError),
+                RETRY_ATTEMPTS,
+                RETRY_BASE_DELAY,
+                RETRY_MAX_DELAY,
+            )
+
+
+def filter_giveaways(
+    giveaways: list[Giveaway],
+    platforms: list[str],
+    giveaway_types: list[str],
+) -> list[Giveaway]:
+    """Return the giveaways matching any of the given platforms and types.
+
+    Mirrors the ``/filter`` endpoint: an empty selection matches everything.
+    """
+    if not platforms and not giveaway_types:
+        return giveaways
+
+    platform_labels = {PLATFORMS[p].lower() for p in platforms if p in PLATFORMS}
+    type_labels = {
+        GIVEAWAY_TYPE_LABELS[t] for t in giveaway_types if t in GIVEAWAY_TYPE_LABELS
+    }
+
+    result: list[Giveaway] = []
+    for giveaway in giveaways:
+        if type_labels and giveaway.type not in type_labels:
+            continue
+        if platform_labels and platform_labels.isdisjoint(
+            label.lower() for label in giveaway.platforms
+        ):
+            continue
+        result.append(giveaway)
+    return result
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if value:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max((parsedate_to_datetime(value) - dt_util.utcnow()).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            pass
+    return DEFAULT_RETRY_AFTER
+
+
+def async_get_hub(hass: HomeAssistant) -> GamerPowerHub:
+    """Return the shared hub, creating it on first use."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (hub := domain_data.get(DATA_HUB)) is None:
+        hub = domain_data[DATA_HUB] = GamerPowerHub(hass)
+    return hub
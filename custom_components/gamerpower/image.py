@@ -0,0 +1,85 @@
+"""Image platform for GamerPower integration."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import GamerPowerCoordinator
+from .entity import GamerPowerEntity
+from .images import GiveawayImageCache, image_cache_dir
+from .models import Giveaway
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up GamerPower images from a config entry."""
+    coordinator: GamerPowerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([GamerPowerLatestGiveawayImage(coordinator, entry)])
+
+
+class GamerPowerLatestGiveawayImage(GamerPowerEntity, ImageEntity):
+    """Artwork of the latest giveaway, kept in a cache of its own on disk."""
+
+    _attr_icon = "mdi:image"
+
+    def __init__(
+        self, coordinator: GamerPowerCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the image."""
+        GamerPowerEntity.__init__(self, coordinator, entry)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._attr_unique_id = f"{entry.entry_id}_latest_giveaway_image"
+        self._attr_name = "Latest Giveaway Image"
+        self._images = GiveawayImageCache(
+            coordinator.hass,
+            coordinator.hub.session,
+            image_cache_dir(coordinator.hass, entry.entry_id),
+        )
+        self._artwork: tuple[int, str, str] | None = None
+        self._update_artwork()
+
+    def _latest(self) -> Giveaway | None:
+        """Return the latest giveaway."""
+        if self.coordinator.data and self.coordinator.data.giveaways:
+            return self.coordinator.data.giveaways[0]
+        return None
+
+    def _update_artwork(self) -> None:
+        """Track the artwork of the latest giveaway, preferring the large image."""
+        artwork: tuple[int, str, str] | None = None
+        if (latest := self._latest()) is not None:
+            if latest.image:
+                artwork = (latest.id, "image", latest.image)
+            elif latest.thumbnail:
+                artwork = (latest.id, "thumbnail", latest.thumbnail)
+        if artwork != self._artwork:
+            self._artwork = artwork
+            self._attr_image_last_updated = dt_util.utcnow()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_artwork()
+        super()._handle_coordinator_update()
+
+    async def async_image(self) -> bytes | None:
+        """Return the artwork bytes from the local cache."""
+        if self._artwork is None:
+            return None
+        giveaway_id, kind, url = self._artwork
+        image = await self._images.async_get(giveaway_id, kind, url)
+        if image is None:
+            return None
+        body, self._attr_content_type = image
+        return body
@@ -0,0 +1,114 @@
+"""On-disk artwork cache for the Latest Giveaway Image entity."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+from pathlib import Path
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, IMAGE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def image_cache_dir(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the directory holding the artwork of a config entry."""
+    return Path(hass.config.path(".cache", DOMAIN, "images", entry_id))
+
+
+def url_digest(url: str) -> str:
+    """Return a short stable digest identifying an artwork URL."""
+    return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+
+
+class GiveawayImageCache:
+    """The one artwork an image entity shows, kept on disk across restarts.
+
+    Giveaway payloads keep linking to the artwork on gamerpower.com; only the
+    image of the entity is served locally. It is downloaded once, concurrent
+    requests share the download, and fetching another artwork replaces the
+    file. The file name carries a digest of the source URL, so changed
+    artwork is downloaded again.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, session: aiohttp.ClientSession, directory: Path
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.session = session
+        self.directory = directory
+        self._inflight: dict[str, asyncio.Task[tuple[bytes, str] | None]] = {}
+
+    async def async_get(
+        self, giveaway_id: int, kind: str, url: str
+    ) -> tuple[bytes, str] | None:
+        """Return an image and its content type, downloading it on a miss."""
+        stem = f"{giveaway_id}_{kind}_{url_digest(url)}"
+        if image := await self.hass.async_add_executor_job(self._read, stem):
+            return image
+
+        if (task := self._inflight.get(stem)) is None:
+            task = self.hass.async_create_task(self._async_download(stem, url))
+            self._inflight[stem] = task
+            task.add_done_callback(lambda _: self._inflight.pop(stem, None))
+        return await asyncio.shield(task)
+
+    async def _async_download(
+        self, stem: str, url: str
+    ) -> tuple[bytes, str] | None:
+        """Download an image and store it on disk in place of the previous one."""
+        try:
+            async with self.session.get(
+                url, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.debug("Status %s downloading %s", response.status, url)
+                    return None
+                if (response.content_length or 0) > IMAGE_MAX_BYTES:
+                    return None
+                body = await response.content.read(IMAGE_MAX_BYTES + 1)
+                content_type = response.content_type
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Error downloading %s: %s", url, err)
+            return None
+        if len(body) > IMAGE_MAX_BYTES or not content_type.startswith("image/"):
+            return None
+
+        extension = mimetypes.guess_extension(content_type) or ".img"
+        await self.hass.async_add_executor_job(
+            self._write, f"{stem}{extension}", body
+        )
+        return body, content_type
+
+    def _read(self, stem: str) -> tuple[bytes, str] | None:
+        """Read the cached file of an artwork, if it is the one on disk."""
+        try:
+            for path in self.directory.iterdir():
+                if path.stem == stem:
+                    return path.read_bytes(), _content_type(path.name)
+        except OSError:
+            pass
+        return None
+
+    def _write(self, name: str, body: bytes) -> None:
+        """Atomically write the cached file, deleting the previous artwork."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f".{name}.tmp"
+        tmp.write_bytes(body)
+        os.replace(tmp, self.directory / name)
+        for path in self.directory.iterdir():
+            # Leave the temporary file of a concurrent download alone
+            if path.name != name and not path.name.startswith("."):
+                path.unlink(missing_ok=True)
+
+
+def _content_type(name: str) -> str:
+    """Return the content type of a cached file from its extension."""
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
@@ -0,0 +1,110 @@
+"""Runtime metrics for the GamerPower integration."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+from typing import Any
+
+# Number of samples kept per phase for the rolling percentiles
+WINDOW = 100
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+class PhaseTimings:
+    """Rolling window of durations for one phase of an update."""
+
+    def __init__(self) -> None:
+        """Initialize the window."""
+        self.samples: deque[float] = deque(maxlen=WINDOW)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """Record a duration."""
+        self.samples.append(seconds)
+        self.count += 1
+
+    @property
+    def last(self) -> float | None:
+        """Return the last duration."""
+        return self.samples[-1] if self.samples else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the last duration and rolling percentiles in milliseconds."""
+        if not self.samples:
+            return {"count": 0}
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "last_ms": round(self.samples[-1] * 1000, 2),
+            "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        }
+
+
+class Metrics:
+    """Counters and per-phase timings collected during updates."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.phases: dict[str, PhaseTimings] = {}
+        # Number of durations recorded, so readers can tell when phases changed
+        self.recorded = 0
+        self.status_codes: Counter[int] = Counter()
+        self.response_bytes = 0
+        self.last_response_bytes: int | None = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as the given phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record the duration of a phase."""
+        if (timings := self.phases.get(phase)) is None:
+            timings = self.phases[phase] = PhaseTimings()
+        timings.record(seconds)
+        self.recorded += 1
+
+    def record_response(self, status: int, size: int | None) -> None:
+        """Record an HTTP response."""
+        self.status_codes[status] += 1
+        if size is not None:
+            self.response_bytes += size
+            self.last_response_bytes = size
+
+    def record_success(self) -> None:
+        """Record a successful update."""
+        self.successes += 1
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed update."""
+        self.failures += 1
+        self.consecutive_failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics as a JSON-serializable dict."""
+        return {
+            "phases": {name: t.as_dict() for name, t in self.phases.items()},
+            "status_codes": {str(code): n for code, n in self.status_codes.items()},
+            "response_bytes": self.response_bytes,
+            "last_response_bytes": self.last_response_bytes,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+        }
@@ -0,0 +1,304 @@
+"""Data models for the GamerPower integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+
+from .const import ATTRIBUTION, DEFAULT_MAX_LIST_ITEMS, MAX_LIST_ATTRIBUTE_BYTES
+from .diff import GiveawayChanges
+from .worth import parse_worth
+
+# Date format used by the API, e.g. "2024-05-31 23:59:00"
+API_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+NOT_AVAILABLE = "N/A"
+
+
+def parse_date(value: str | None) -> datetime | None:
+    """Parse an API date, which is given in UTC, or "N/A"."""
+    if not value or value == NOT_AVAILABLE:
+        return None
+    try:
+        return datetime.strptime(value, API_DATE_FORMAT).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def format_date(value: datetime | None) -> str:
+    """Format a date the way the API does."""
+    return value.strftime(API_DATE_FORMAT) if value else NOT_AVAILABLE
+
+
+class Giveaway:
+    """Compact giveaway record, parsed once when the catalogue changes.
+
+    Worth, platforms and dates are stored parsed. The long HTML
+    ``description`` and ``instructions`` are not kept here; the hub stores
+    them separately (see ``split_text``).
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "worth",
+        "type",
+        "platforms",
+        "thumbnail",
+        "image",
+        "open_giveaway_url",
+        "gamerpower_url",
+        "published_date",
+        "end_date",
+        "status",
+        "users",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        worth: float | None,
+        type: str,
+        platforms: tuple[str, ...],
+        thumbnail: str | None,
+        image: str | None,
+        open_giveaway_url: str | None,
+        gamerpower_url: str | None,
+        published_date: datetime | None,
+        end_date: datetime | None,
+        status: str | None,
+        users: int | None,
+    ) -> None:
+        """Initialize the record."""
+        self.id = id
+        self.title = title
+        self.worth = worth
+        self.type = type
+        self.platforms = platforms
+        self.thumbnail = thumbnail
+        self.image = image
+        self.open_giveaway_url = open_giveaway_url
+        self.gamerpower_url = gamerpower_url
+        self.published_date = published_date
+        self.end_date = end_date
+        self.status = status
+        self.users = users
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> Giveaway:
+        """Build a record from an API giveaway dict."""
+        return cls(
+            id=raw["id"],
+            title=raw.get("title") or "Unknown",
+            worth=parse_worth(raw.get("worth")),
+            type=raw.get("type") or "unknown",
+            platforms=tuple(
+                p.strip() for p in (raw.get("platforms") or "").split(",") if p.strip()
+            ),
+            thumbnail=raw.get("thumbnail"),
+            image=raw.get("image"),
+            open_giveaway_url=raw.get("open_giveaway_url"),
+            gamerpower_url=raw.get("gamerpower_url"),
+            published_date=parse_date(raw.get("published_date")),
+            end_date=parse_date(raw.get("end_date")),
+            status=raw.get("status"),
+            users=raw.get("users"),
+        )
+
+    @property
+    def worth_text(self) -> str:
+        """Return the worth formatted the way the API does."""
+        return f"${self.worth:,.2f}" if self.worth is not None else NOT_AVAILABLE
+
+    @property
+    def platforms_text(self) -> str:
+        """Return the platforms formatted the way the API does."""
+        return ", ".join(self.platforms)
+
+    def as_dict(self, text: tuple[str, str] | None = None) -> dict[str, Any]:
+        """Return the record in the API format, with its text if given."""
+        description, instructions = text or (None, None)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "worth": self.worth_text,
+            "thumbnail": self.thumbnail,
+            "image": self.image,
+            "description": description,
+            "instructions": instructions,
+            "open_giveaway_url": self.open_giveaway_url,
+            "published_date": format_date(self.published_date),
+            "type": self.type,
+            "platforms": self.platforms_text,
+            "end_date": format_date(self.end_date),
+            "users": self.users,
+            "status": self.status,
+            "gamerpower_url": self.gamerpower_url,
+        }
+
+
+def split_text(raw: dict[str, Any]) -> tuple[str, str] | None:
+    """Return the heavy text fields of an API giveaway dict."""
+    description = raw.get("description")
+    instructions = raw.get("instructions")
+    if not description and not instructions:
+        return None
+    return (description or "", instructions or "")
+
+
+def parse_giveaways(
+    raw_giveaways: list[dict[str, Any]],
+) -> tuple[list[Giveaway], dict[int, tuple[str, str]]]:
+    """Parse an API payload into records and their separately stored text."""
+    giveaways: list[Giveaway] = []
+    texts: dict[int, tuple[str, str]] = {}
+    for raw in raw_giveaways:
+        giveaway = Giveaway.from_dict(raw)
+        giveaways.append(giveaway)
+        if (text := split_text(raw)) is not None:
+            texts[giveaway.id] = text
+    return giveaways, texts
+
+
+def split_expired(
+    giveaways: list[Giveaway], now: datetime
+) -> tuple[list[Giveaway], list[Giveaway]]:
+    """Split giveaways into those still running and those past their end date."""
+    active: list[Giveaway] = []
+    expired: list[Giveaway] = []
+    for giveaway in giveaways:
+        if giveaway.end_date is not None and giveaway.end_date <= now:
+            expired.append(giveaway)
+        else:
+            active.append(giveaway)
+    return active, expired
+
+
+def compact_giveaway(giveaway: Giveaway) -> dict[str, Any]:
+    """Return the small subset of giveaway fields exposed in lists."""
+    return {
+        "id": giveaway.id,
+        "title": giveaway.title,
+        "type": giveaway.type,
+        "platforms": giveaway.platforms_text,
+        "worth": giveaway.worth_text,
+        "thumbnail": giveaway.thumbnail,
+        "open_giveaway_url": giveaway.open_giveaway_url,
+        "end_date": format_date(giveaway.end_date),
+    }
+
+
+def project_giveaways(
+    giveaways: list[Giveaway],
+    max_items: int = DEFAULT_MAX_LIST_ITEMS,
+    max_bytes: int = MAX_LIST_ATTRIBUTE_BYTES,
+) -> list[dict[str, Any]]:
+    """Project the leading giveaways until the item or byte budget is spent."""
+    projected: list[dict[str, Any]] = []
+    size = 0
+    for giveaway in giveaways[:max_items]:
+        item = compact_giveaway(giveaway)
+        size += len(json_bytes(item))
+        if size > max_bytes:
+            break
+        projected.append(item)
+    return projected
+
+
+@dataclass(slots=True)
+class GroupTotals:
+    """Number and summed worth of the giveaways of one platform or type."""
+
+    label: str
+    count: int = 0
+    worth: float = 0.0
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class GamerPowerData:
+    """Immutable snapshot built once per successful coordinator update.
+
+    Everything the sensors expose is precomputed here, so entities only look
+    values up. ``generation`` changes with every new snapshot and lets
+    entities memoize the attribute dicts they derive from it.
+    """
+
+    generation: int
+    giveaways: list[Giveaway]
+    changes: GiveawayChanges
+    worth: dict[str, Any]
+    type_counts: dict[str, int]
+    # Totals per lowercased platform label and per type label; like the
+    # filters, platforms match case-insensitively
+    platform_groups: dict[str, GroupTotals]
+    type_groups: dict[str, GroupTotals]
+    projected: list[dict[str, Any]]
+    # Earliest end date in the list, when the next local prune is due
+    next_expiry: datetime | None = None
+    attribution: str = ATTRIBUTION
+
+    @property
+    def new_giveaways(self) -> list[Giveaway]:
+        """Return the giveaways added since the previous snapshot."""
+        return self.changes.added
+
+    @classmethod
+    def build(
+        cls,
+        generation: int,
+        giveaways: list[Giveaway],
+        changes: GiveawayChanges,
+        max_items: int = DEFAULT_MAX_LIST_ITEMS,
+    ) -> GamerPowerData:
+        """Build a snapshot from a filtered giveaway list in a single pass.
+
+        The same pass groups the giveaways by platform and by type; the worth
+        totals and the per-platform and per-type sensors are derived from
+        these groups.
+        """
+        platform_groups: dict[str, GroupTotals] = {}
+        type_groups: dict[str, GroupTotals] = {}
+        total_worth = 0.0
+        next_expiry: datetime | None = None
+        for giveaway in giveaways:
+            worth = giveaway.worth or 0.0
+            total_worth += worth
+            if (group := type_groups.get(giveaway.type)) is None:
+                group = type_groups[giveaway.type] = GroupTotals(giveaway.type)
+            group.count += 1
+            group.worth += worth
+            if (end_date := giveaway.end_date) is not None and (
+                next_expiry is None or end_date < next_expiry
+            ):
+                next_expiry = end_date
+            for platform in giveaway.platforms:
+                if (group := platform_groups.get(key := platform.lower())) is None:
+                    group = platform_groups[key] = GroupTotals(platform)
+                group.count += 1
+                group.worth += worth
+
+        return cls(
+            generation=generation,
+            giveaways=giveaways,
+            changes=changes,
+            worth={
+                "active_giveaways_number": len(giveaways),
+                "worth_estimation_usd": round(total_worth, 2),
+                "by_platform": _group_worth(platform_groups),
+                "by_type": _group_worth(type_groups),
+            },
+            type_counts={group.label: group.count for group in type_groups.values()},
+            platform_groups=platform_groups,
+            type_groups=type_groups,
+            projected=project_giveaways(giveaways, max_items),
+            next_expiry=next_expiry,
+        )
+
+
+def _group_worth(groups: dict[str, GroupTotals]) -> dict[str, float]:
+    """Return the rounded worth of the groups holding giveaways with a worth."""
+    return {
+        group.label: round(group.worth, 2) for group in groups.values() if group.worth
+    }
@@ -0,0 +1,91 @@
+"""Retry and circuit breaker helpers for GamerPower API calls."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import random
+import time
+from typing import TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+async def async_retry(
+    func: Callable[[], Awaitable[_T]],
+    retry_on: tuple[type[BaseException], ...],
+    attempts: int,
+    base_delay: float,
+    max_delay: float,
+) -> _T:
+    """Call ``func``, retrying transient errors with full-jitter backoff.
+
+    The delay before retry ``n`` is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2**n)]`` so clients recovering from the
+    same blip do not retry in lockstep.
+    """
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except retry_on as err:
+            if attempt == attempts - 1:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+            _LOGGER.debug(
+                "Attempt %s/%s failed (%s), retrying in %.1fs",
+                attempt + 1,
+                attempts,
+                err,
+                delay,
+            )
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+class CircuitBreaker:
+    """Stop calling a failing API for a while.
+
+    After ``threshold`` consecutive failures the circuit opens and requests are
+    refused for ``cooldown`` seconds. The first request after that is a trial:
+    success closes the circuit, failure opens it again with a doubled cooldown,
+    up to ``max_cooldown``.
+    """
+
+    def __init__(self, threshold: int, cooldown: float, max_cooldown: float) -> None:
+        """Initialize the circuit breaker."""
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if requests are currently refused."""
+        return self.opened_at is not None and self.retry_in > 0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next trial request is allowed."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.opened_at + self.cooldown - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self.cooldown = self.base_cooldown
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit past the threshold."""
+        self.failures += 1
+        if self.opened_at is not None:
+            # The trial request failed
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self.opened_at = time.monotonic()
+        elif self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
@@ -0,0 +1,79 @@
+"""Adaptive polling scheduler for the GamerPower integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+# Interval multipliers applied after each poll
+TIGHTEN_FACTOR = 0.5
+RELAX_FACTOR = 1.5
+# Polls without changes before the interval starts to relax
+QUIET_POLLS_BEFORE_RELAX = 3
+# Weight kept by the hourly publish histogram on every new observation
+HOURLY_DECAY = 0.97
+# Observations needed before publish hours are trusted
+MIN_OBSERVATIONS = 5
+
+
+class AdaptiveScheduler:
+    """Pick the next polling interval from observed changes and errors.
+
+    The interval halves while the giveaway IDs keep changing, grows during
+    long quiet stretches and never exceeds the configured interval during the
+    hours GamerPower usually publishes in. Failures back off exponentially and
+    a ``Retry-After`` from the API always wins. Every interval is clamped to
+    ``[minimum, maximum]``.
+    """
+
+    def __init__(
+        self, interval: timedelta, minimum: timedelta, maximum: timedelta
+    ) -> None:
+        """Initialize the scheduler around the configured interval."""
+        self.base = interval
+        self.minimum = minimum
+        self.maximum = maximum
+        self.interval = interval
+        self._quiet_polls = 0
+        self._failures = 0
+        self._hourly = [0.0] * 24
+        self._observations = 0
+
+    def record_success(self, changed: bool, now: datetime) -> timedelta:
+        """Return the next interval after a successful poll."""
+        self._failures = 0
+        if changed:
+            self._quiet_polls = 0
+            self._record_publish(now.hour)
+            interval = self.interval * TIGHTEN_FACTOR
+        else:
+            self._quiet_polls += 1
+            interval = self.interval
+            if self._quiet_polls >= QUIET_POLLS_BEFORE_RELAX:
+                interval = self.interval * RELAX_FACTOR
+            if self._is_publish_hour((now + interval).hour):
+                interval = min(interval, self.base)
+        self.interval = self._clamp(interval)
+        return self.interval
+
+    def record_failure(self, retry_after: float | None = None) -> timedelta:
+        """Return the next interval after a failed poll."""
+        self._failures += 1
+        interval = self._clamp(self.base * 2 ** (self._failures - 1))
+        if retry_after is not None:
+            interval = min(max(interval, timedelta(seconds=retry_after)), self.maximum)
+        return interval
+
+    def _record_publish(self, hour: int) -> None:
+        """Learn that giveaways were published during the given hour."""
+        self._hourly = [count * HOURLY_DECAY for count in self._hourly]
+        self._hourly[hour] += 1
+        self._observations += 1
+
+    def _is_publish_hour(self, hour: int) -> bool:
+        """Return True if the given hour usually sees new giveaways."""
+        if self._observations < MIN_OBSERVATIONS:
+            return False
+        return self._hourly[hour] > 1.5 * sum(self._hourly) / 24
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        """Clamp an interval to the configured bounds."""
+        return max(self.minimum, min(self.maximum, interval))
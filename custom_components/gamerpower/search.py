@@ -0,0 +1,216 @@
+"""In-memory search index over the giveaways of a coordinator."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+import math
+import re
+from typing import TYPE_CHECKING
+
+from .const import SORT_END_DATE, SORT_NEWEST, SORT_TITLE, SORT_WORTH
+
+if TYPE_CHECKING:
+    from .models import Giveaway
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> set[str]:
+    """Return the lowercase word tokens of a text."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _indexed_fields(giveaway: Giveaway) -> tuple[object, ...]:
+    """Return the values the index is built from."""
+    return (
+        giveaway.title,
+        giveaway.platforms,
+        giveaway.type,
+        giveaway.worth,
+        giveaway.end_date,
+    )
+
+
+class GiveawayIndex:
+    """Incrementally maintained index answering combined giveaway queries.
+
+    Holds an inverted index of title tokens, posting sets per platform and per
+    type, and (value, id) arrays sorted by worth and by end date for range
+    queries. ``sync`` only re-indexes the giveaways whose indexed fields
+    changed since the previous list.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.giveaways: dict[int, Giveaway] = {}
+        self._tokens: dict[str, set[int]] = {}
+        self._vocabulary: list[str] | None = None
+        self._platforms: dict[str, set[int]] = {}
+        self._types: dict[str, set[int]] = {}
+        self._by_worth: list[tuple[float, int]] = []
+        self._by_end_date: list[tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed giveaways."""
+        return len(self.giveaways)
+
+    def sync(self, giveaways: list[Giveaway]) -> None:
+        """Bring the index in line with a new giveaway list."""
+        current = {giveaway.id: giveaway for giveaway in giveaways}
+        for giveaway_id in [gid for gid in self.giveaways if gid not in current]:
+            self._remove(self.giveaways.pop(giveaway_id))
+
+        for giveaway_id, giveaway in current.items():
+            if (old := self.giveaways.get(giveaway_id)) is None:
+                self._add(giveaway)
+            elif old is not giveaway and _indexed_fields(old) != _indexed_fields(
+                giveaway
+            ):
+                self._remove(old)
+                self._add(giveaway)
+            self.giveaways[giveaway_id] = giveaway
+
+    def _add(self, giveaway: Giveaway) -> None:
+        """Index a giveaway."""
+        giveaway_id = giveaway.id
+        for token in tokenize(giveaway.title):
+            if token not in self._tokens:
+                self._tokens[token] = set()
+                self._vocabulary = None
+            self._tokens[token].add(giveaway_id)
+        for platform in giveaway.platforms:
+            self._platforms.setdefault(platform.lower(), set()).add(giveaway_id)
+        self._types.setdefault(giveaway.type, set()).add(giveaway_id)
+        if giveaway.worth is not None:
+            insort(self._by_worth, (giveaway.worth, giveaway_id))
+        if giveaway.end_date is not None:
+            insort(self._by_end_date, (giveaway.end_date.timestamp(), giveaway_id))
+
+    def _remove(self, giveaway: Giveaway) -> None:
+        """Drop a giveaway from the index."""
+        giveaway_id = giveaway.id
+        for token in tokenize(giveaway.title):
+            _discard(self._tokens, token, giveaway_id)
+            if token not in self._tokens:
+                self._vocabulary = None
+        for platform in giveaway.platforms:
+            _discard(self._platforms, platform.lower(), giveaway_id)
+        _discard(self._types, giveaway.type, giveaway_id)
+        if giveaway.worth is not None:
+            _remove_sorted(self._by_worth, (giveaway.worth, giveaway_id))
+        if giveaway.end_date is not None:
+            _remove_sorted(
+                self._by_end_date, (giveaway.end_date.timestamp(), giveaway_id)
+            )
+
+    def search(
+        self,
+        query: str | None = None,
+        platforms: list[str] | None = None,
+        types: list[str] | None = None,
+        min_worth: float | None = None,
+        max_worth: float | None = None,
+        ends_after: datetime | None = None,
+        ends_before: datetime | None = None,
+        sort: str = SORT_NEWEST,
+    ) -> list[Giveaway]:
+        """Return the giveaways matching every given criterion, sorted.
+
+        Every word of ``query`` must prefix a word of the title. ``platforms``
+        (lowercase labels) and ``types`` (type labels) match any of their
+        values. Worth and end date bounds are inclusive, and exclude
+        giveaways without a worth or an end date.
+        """
+        candidates: list[set[int]] = []
+        if query:
+            for token in tokenize(query):
+                candidates.append(self._match_prefix(token))
+        if platforms:
+            candidates.append(
+                set().union(*(self._platforms.get(p, set()) for p in platforms))
+            )
+        if types:
+            candidates.append(set().union(*(self._types.get(t, set()) for t in types)))
+        if min_worth is not None or max_worth is not None:
+            candidates.append(
+                _range(
+                    self._by_worth,
+                    -math.inf if min_worth is None else min_worth,
+                    math.inf if max_worth is None else max_worth,
+                )
+            )
+        if ends_after is not None or ends_before is not None:
+            candidates.append(
+                _range(
+                    self._by_end_date,
+                    -math.inf if ends_after is None else ends_after.timestamp(),
+                    math.inf if ends_before is None else ends_before.timestamp(),
+                )
+            )
+
+        if candidates:
+            # Intersect the smallest sets first
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+        else:
+            ids = set(self.giveaways)
+        return self._sorted([self.giveaways[gid] for gid in ids], sort)
+
+    def _match_prefix(self, prefix: str) -> set[int]:
+        """Return the IDs of giveaways with a title word starting with ``prefix``."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._tokens)
+        matches: set[int] = set()
+        start = bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            matches |= self._tokens[token]
+        return matches
+
+    @staticmethod
+    def _sorted(giveaways: list[Giveaway], sort: str) -> list[Giveaway]:
+        """Sort search results; missing values go last."""
+        if sort == SORT_WORTH:
+            giveaways.sort(key=lambda g: (g.worth is None, -(g.worth or 0), g.id))
+        elif sort == SORT_END_DATE:
+            giveaways.sort(
+                key=lambda g: (
+                    g.end_date is None,
+                    g.end_date.timestamp() if g.end_date else 0,
+                    g.id,
+                )
+            )
+        elif sort == SORT_TITLE:
+            giveaways.sort(key=lambda g: (g.title.casefold(), g.id))
+        else:
+            giveaways.sort(
+                key=lambda g: (
+                    g.published_date is None,
+                    -g.published_date.timestamp() if g.published_date else 0,
+                    -g.id,
+                )
+            )
+        return giveaways
+
+
+def _discard(postings: dict[str, set[int]], key: str, giveaway_id: int) -> None:
+    """Remove an ID from a posting set, dropping the set once empty."""
+    if (ids := postings.get(key)) is not None:
+        ids.discard(giveaway_id)
+        if not ids:
+            del postings[key]
+
+
+def _remove_sorted(values: list[tuple[float, int]], item: tuple[float, int]) -> None:
+    """Remove an item from a sorted array."""
+    index = bisect_left(values, item)
+    if index < len(values) and values[index] == item:
+        del values[index]
+
+
+def _range(values: list[tuple[float, int]], low: float, high: float) -> set[int]:
+    """Return the IDs whose value lies in ``[low, high]`` of a sorted array."""
+    start = bisect_left(values, (low, -math.inf))
+    end = bisect_right(values, (high, math.inf))
+    return {giveaway_id for _, giveaway_id in values[start:end]}
@@ -10,16 +10,36 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN
-from .coordinator import GamerPowerCoordinator
+from .const import (
+    DOMAIN,
+    GIVEAWAY_TYPE_LABELS,
+    GIVEAWAY_TYPES,
+    GROUP_PLATFORM,
+    GROUP_TYPE,
+    PLATFORMS,
+)
+from .coordinator import GamerPowerCoordinator, signal_metrics_updated
+from .entity import GamerPowerEntity
+from .models import GamerPowerData, GroupTotals
 
 _LOGGER = logging.getLogger(__name__)
 
+# Breakdown sensors that can be created: (group, key, key of the group in the
+# snapshot, name); platform groups are keyed by their lowercased label
+GROUP_SENSORS: list[tuple[str, str, str, str]] = [
+    *((GROUP_PLATFORM, key, label.lower(), label) for key, label in PLATFORMS.items()),
+    *(
+        (GROUP_TYPE, key, GIVEAWAY_TYPE_LABELS[key], name)
+        for key, name in GIVEAWAY_TYPES.items()
+    ),
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,17 +54,78 @@ async def async_setup_entry(
         GamerPowerTotalWorthSensor(coordinator, entry),
         GamerPowerLatestGiveawaySensor(coordinator, entry),
         GamerPowerActiveGiveawaysListSensor(coordinator, entry),
+        GamerPowerUpdateDurationSensor(coordinator, entry),
+        GamerPowerConsecutiveFailuresSensor(coordinator, entry),
     ]
 
     async_add_entities(entities)
+    _async_track_group_sensors(hass, coordinator, entry, async_add_entities)
 
 
-class GamerPowerBaseSensor(CoordinatorEntity[GamerPowerCoordinator], SensorEntity):
+@callback
+def _async_track_group_sensors(
+    hass: HomeAssistant,
+    coordinator: GamerPowerCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add and remove the per-platform and per-type sensors with their groups.
+
+    With the breakdown option on, a sensor exists for each platform and type
+    present in the snapshot. Sensors of groups that disappear, or of a
+    previous run, are removed from the entity registry.
+    """
+    registry = er.async_get(hass)
+    prefixes = (
+        f"{entry.entry_id}_{GROUP_PLATFORM}_",
+        f"{entry.entry_id}_{GROUP_TYPE}_",
+    )
+    added: set[str] = set()
+
+    @callback
+    def _async_sync() -> None:
+        """Bring the breakdown sensors in line with the current snapshot."""
+        if (data := coordinator.data) is None:
+            return
+        wanted: set[str] = set()
+        new_entities: list[SensorEntity] = []
+        if coordinator.breakdown_sensors:
+            groups = {
+                GROUP_PLATFORM: data.platform_groups,
+                GROUP_TYPE: data.type_groups,
+            }
+            for group, key, group_key, name in GROUP_SENSORS:
+                if group_key not in groups[group]:
+                    continue
+                unique_id = f"{entry.entry_id}_{group}_{key}"
+                wanted.add(unique_id)
+                if unique_id not in added:
+                    added.add(unique_id)
+                    new_entities.append(
+                        GamerPowerGroupSensor(
+                            coordinator, entry, group, key, group_key, name
+                        )
+                    )
+
+        for registry_entry in er.async_entries_for_config_entry(
+            registry, entry.entry_id
+        ):
+            if (
+                registry_entry.unique_id.startswith(prefixes)
+                and registry_entry.unique_id not in wanted
+            ):
+                registry.async_remove(registry_entry.entity_id)
+        added.intersection_update(wanted)
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_sync()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync))
+
+
+class GamerPowerBaseSensor(GamerPowerEntity, SensorEntity):
     """Base class for GamerPower sensors."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-
     def __init__(
         self,
         coordinator: GamerPowerCoordinator,
@@ -53,21 +134,32 @@ class GamerPowerBaseSensor(CoordinatorEntity[GamerPowerCoordinator], SensorEntit
         name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._attr_name = name
-        self._entry = entry
+        self._attrs_generation: int | None = None
+        self._attrs: dict[str, Any] = {}
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="GamerPower Giveaways",
-            manufacturer="GamerPower.com",
-            model="Game Giveaway Tracker",
-            configuration_url="https://www.gamerpower.com",
-        )
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes, built once per coordinator snapshot.
+
+        While the coordinator serves its last good snapshot through API
+        failures, the attributes carry ``stale: true``.
+        """
+        data = self.coordinator.data
+        if data is None:
+            return {}
+        if self._attrs_generation != data.generation:
+            self._attrs = self._build_attributes(data)
+            self._attrs_generation = data.generation
+        if self.coordinator.stale:
+            return {**self._attrs, "stale": True}
+        return self._attrs
+
+    def _build_attributes(self, data: GamerPowerData) -> dict[str, Any]:
+        """Build the extra attributes from a snapshot."""
+        return {}
 
 
 class GamerPowerTotalGiveawaysSensor(GamerPowerBaseSensor):
@@ -85,26 +177,16 @@ class GamerPowerTotalGiveawaysSensor(GamerPowerBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the total number of giveaways."""
-        if self.coordinator.data and "giveaways" in self.coordinator.data:
-            return len(self.coordinator.data["giveaways"])
+        if self.coordinator.data:
+            return len(self.coordinator.data.giveaways)
         return 0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: GamerPowerData) -> dict[str, Any]:
         """Return extra attributes."""
-        attrs: dict[str, Any] = {}
-        if self.coordinator.data:
-            worth = self.coordinator.data.get("worth", {})
-            attrs["active_giveaways_count"] = worth.get("active_giveaways_number", 0)
-            
-            # Count by type
-            giveaways = self.coordinator.data.get("giveaways", [])
-            type_counts: dict[str, int] = {}
-            for giveaway in giveaways:
-                gtype = giveaway.get("type", "unknown")
-                type_counts[gtype] = type_counts.get(gtype, 0) + 1
-            attrs["by_type"] = type_counts
-        return attrs
+        return {
+            "active_giveaways_count": data.worth.get("active_giveaways_number", 0),
+            "by_type": data.type_counts,
+        }
 
 
 class GamerPowerTotalWorthSensor(GamerPowerBaseSensor):
@@ -125,17 +207,16 @@ class GamerPowerTotalWorthSensor(GamerPowerBaseSensor):
     def native_value(self) -> float | None:
         """Return the total worth."""
         if self.coordinator.data:
-            worth = self.coordinator.data.get("worth", {})
-            worth_str = worth.get("worth_estimation_usd", "0")
-            # Parse worth string like "$1,234.56"
-            if isinstance(worth_str, str):
-                try:
-                    return float(worth_str.replace("$", "").replace(",", "").replace("~", ""))
-                except ValueError:
-                    return None
-            return worth_str
+            return self.coordinator.data.worth.get("worth_estimation_usd")
         return None
 
+    def _build_attributes(self, data: GamerPowerData) -> dict[str, Any]:
+        """Return the worth breakdown by platform and type."""
+        return {
+            "by_platform": data.worth.get("by_platform", {}),
+            "by_type": data.worth.get("by_type", {}),
+        }
+
 
 class GamerPowerLatestGiveawaySensor(GamerPowerBaseSensor):
     """Sensor showing the latest giveaway."""
@@ -151,41 +232,36 @@ class GamerPowerLatestGiveawaySensor(GamerPowerBaseSensor):
     @property
     def native_value(self) -> str | None:
         """Return the title of the latest giveaway."""
-        if self.coordinator.data:
-            giveaways = self.coordinator.data.get("giveaways", [])
-            if giveaways:
-                return giveaways[0].get("title", "Unknown")
+        if self.coordinator.data and self.coordinator.data.giveaways:
+            return self.coordinator.data.giveaways[0].title
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_attributes(self, data: GamerPowerData) -> dict[str, Any]:
         """Return extra attributes about the latest giveaway."""
-        attrs: dict[str, Any] = {}
-        if self.coordinator.data:
-            giveaways = self.coordinator.data.get("giveaways", [])
-            if giveaways:
-                latest = giveaways[0]
-                attrs["id"] = latest.get("id")
-                attrs["title"] = latest.get("title")
-                attrs["type"] = latest.get("type")
-                attrs["platforms"] = latest.get("platforms")
-                attrs["worth"] = latest.get("worth")
-                attrs["thumbnail"] = latest.get("thumbnail")
-                attrs["image"] = latest.get("image")
-                attrs["description"] = latest.get("description")
-                attrs["instructions"] = latest.get("instructions")
-                attrs["open_giveaway_url"] = latest.get("open_giveaway_url")
-                attrs["gamerpower_url"] = latest.get("gamerpower_url")
-                attrs["published_date"] = latest.get("published_date")
-                attrs["end_date"] = latest.get("end_date")
-                attrs["status"] = latest.get("status")
-        return attrs
+        if not data.giveaways:
+            return {}
+        latest = data.giveaways[0]
+        return latest.as_dict(self.coordinator.hub.texts.get(latest.id))
 
 
 class GamerPowerActiveGiveawaysListSensor(GamerPowerBaseSensor):
-    """Sensor with a list of all active giveaways in attributes."""
+    """Sensor with a bounded list of the active giveaways in attributes.
+
+    Only the first page fits in the attributes; the ``list_giveaways`` service
+    returns further pages on demand.
+    """
 
     _attr_icon = "mdi:format-list-bulleted"
+    _unrecorded_attributes = frozenset(
+        {
+            "giveaways",
+            "by_platform",
+            "new_since_last_update",
+            "updated_since_last_update",
+            "expired_since_last_update",
+            "removed_since_last_update",
+        }
+    )
 
     def __init__(
         self, coordinator: GamerPowerCoordinator, entry: ConfigEntry
@@ -199,44 +275,182 @@ class GamerPowerActiveGiveawaysListSensor(GamerPowerBaseSensor):
     def native_value(self) -> int:
         """Return the count of active giveaways."""
         if self.coordinator.data:
-            return len(self.coordinator.data.get("giveaways", []))
+            return len(self.coordinator.data.giveaways)
         return 0
 
+    def _build_attributes(self, data: GamerPowerData) -> dict[str, Any]:
+        """Return the first page of giveaways as attributes."""
+        # Group the shown giveaways, the leading ones of the list, by platform
+        by_platform: dict[str, list[str]] = {}
+        for giveaway in data.giveaways[: len(data.projected)]:
+            for platform in giveaway.platforms:
+                by_platform.setdefault(platform, []).append(giveaway.title)
+
+        return {
+            "giveaways": data.projected,
+            "shown": len(data.projected),
+            "total": len(data.giveaways),
+            "by_platform": by_platform,
+            "new_since_last_update": [g.title for g in data.new_giveaways],
+            "updated_since_last_update": [g.title for g, _ in data.changes.updated],
+            "expired_since_last_update": [g.title for g in data.changes.expired],
+            "removed_since_last_update": data.changes.removed,
+        }
+
+
+class GamerPowerGroupSensor(GamerPowerBaseSensor):
+    """Number and worth of the giveaways of one platform or one type.
+
+    Read from the totals grouped while building the snapshot, so any number
+    of these sensors costs no extra request or pass over the giveaways.
+    """
+
+    _attr_icon = "mdi:gift-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: GamerPowerCoordinator,
+        entry: ConfigEntry,
+        group: str,
+        key: str,
+        group_key: str,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, f"{group}_{key}", f"{name} Giveaways")
+        self._group = group
+        self._group_key = group_key
+
+    def _totals(self, data: GamerPowerData | None) -> GroupTotals | None:
+        """Return the totals of the group in a snapshot."""
+        if data is None:
+            return None
+        if self._group == GROUP_PLATFORM:
+            return data.platform_groups.get(self._group_key)
+        return data.type_groups.get(self._group_key)
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of giveaways in the group."""
+        if totals := self._totals(self.coordinator.data):
+            return totals.count
+        return 0
+
+    def _build_attributes(self, data: GamerPowerData) -> dict[str, Any]:
+        """Return the worth of the group."""
+        totals = self._totals(data)
+        return {
+            self._group: totals.label if totals else self._group_key,
+            "worth_usd": round(totals.worth, 2) if totals else 0.0,
+        }
+
+
+class GamerPowerDiagnosticSensor(GamerPowerBaseSensor):
+    """Base class for sensors exposing coordinator metrics.
+
+    Metrics change on every update attempt, including the ones that leave the
+    data untouched, so these sensors follow a dedicated dispatcher signal.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to metric updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_metrics_updated(self.coordinator.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True; metrics are meaningful while updates fail."""
+        return True
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return all giveaways as attributes."""
-        attrs: dict[str, Any] = {"giveaways": []}
-        if self.coordinator.data:
-            giveaways = self.coordinator.data.get("giveaways", [])
-            # Store simplified giveaway info
-            attrs["giveaways"] = [
-                {
-                    "id": g.get("id"),
-                    "title": g.get("title"),
-                    "type": g.get("type"),
-                    "platforms": g.get("platforms"),
-                    "worth": g.get("worth"),
-                    "thumbnail": g.get("thumbnail"),
-                    "open_giveaway_url": g.get("open_giveaway_url"),
-                    "end_date": g.get("end_date"),
-                }
-                for g in giveaways[:50]  # Limit to 50 to avoid too large attributes
-            ]
-            
-            # Group by platform
-            by_platform: dict[str, list[str]] = {}
-            for g in giveaways:
-                platforms = g.get("platforms", "").split(", ")
-                for platform in platforms:
-                    if platform:
-                        if platform not in by_platform:
-                            by_platform[platform] = []
-                        by_platform[platform].append(g.get("title", "Unknown"))
-            attrs["by_platform"] = by_platform
-            
-            # New giveaways since last update
-            new_giveaways = self.coordinator.data.get("new_giveaways", [])
-            attrs["new_since_last_update"] = [
-                g.get("title") for g in new_giveaways
-            ]
-        return attrs
+        """Return metric attributes."""
+        return {}
+
+
+class GamerPowerUpdateDurationSensor(GamerPowerDiagnosticSensor):
+    """Sensor showing how long the last update took."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    # Percentiles move on every poll; keep them out of the recorder
+    _unrecorded_attributes = frozenset({"phases"})
+
+    def __init__(
+        self, coordinator: GamerPowerCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "update_duration", "Update Duration")
+        self._phases_recorded: tuple[int, int] | None = None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the last update in milliseconds."""
+        if (timings := self.coordinator.metrics.phases.get("update")) is None:
+            return None
+        return round(timings.last * 1000, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return rolling percentiles per update phase.
+
+        Rebuilt only when a duration was recorded since the last state write.
+        """
+        metrics = self.coordinator.metrics
+        hub_metrics = self.coordinator.hub.metrics
+        recorded = (metrics.recorded, hub_metrics.recorded)
+        if recorded != self._phases_recorded:
+            phases = {name: t.as_dict() for name, t in metrics.phases.items()}
+            phases.update(
+                (f"hub_{name}", timings.as_dict())
+                for name, timings in hub_metrics.phases.items()
+            )
+            self._attrs = {"phases": phases}
+            self._phases_recorded = recorded
+        return self._attrs
+
+
+class GamerPowerConsecutiveFailuresSensor(GamerPowerDiagnosticSensor):
+    """Sensor showing the number of consecutive failed updates."""
+
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: GamerPowerCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, entry, "consecutive_failures", "Consecutive Failures"
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of consecutive failed updates."""
+        return self.coordinator.metrics.consecutive_failures
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return update and HTTP counters."""
+        metrics = self.coordinator.metrics
+        hub_metrics = self.coordinator.hub.metrics
+        return {
+            "successes": metrics.successes,
+            "failures": metrics.failures,
+            "status_codes": {
+                str(code): count for code, count in hub_metrics.status_codes.items()
+            },
+            "last_response_bytes": hub_metrics.last_response_bytes,
+        }
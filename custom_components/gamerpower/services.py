@@ -0,0 +1,261 @@
+"""Services for the GamerPower integration."""
+from __future__ import annotations
+
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    DEFAULT_MAX_LIST_ITEMS,
+    DOMAIN,
+    GIVEAWAY_TYPE_LABELS,
+    GROUP_NONE,
+    GROUP_OPTIONS,
+    MAX_BATCH_GIVEAWAYS,
+    MAX_LIST_ITEMS,
+    PLATFORMS,
+    SERVICE_GET_GIVEAWAY,
+    SERVICE_GET_GIVEAWAYS,
+    SERVICE_LIST_GIVEAWAYS,
+    SERVICE_QUERY_ARCHIVE,
+    SERVICE_REFRESH,
+    SERVICE_SEARCH,
+    SORT_NEWEST,
+    SORT_OPTIONS,
+)
+from .models import compact_giveaway
+
+if TYPE_CHECKING:
+    from .coordinator import GamerPowerCoordinator
+    from .models import Giveaway
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTRY_SCHEMA = {vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string}
+
+PAGE_SCHEMA = {
+    vol.Optional("page", default=1): cv.positive_int,
+    vol.Optional("page_size", default=DEFAULT_MAX_LIST_ITEMS): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_LIST_ITEMS)
+    ),
+}
+
+FILTER_SCHEMA = {
+    vol.Optional("platforms", default=[]): vol.All(
+        cv.ensure_list, [vol.In(PLATFORMS)]
+    ),
+    vol.Optional("types", default=[]): vol.All(
+        cv.ensure_list, [vol.In(GIVEAWAY_TYPE_LABELS)]
+    ),
+}
+
+
+def _loaded_coordinators(hass: HomeAssistant) -> list[GamerPowerCoordinator]:
+    """Return the coordinators of the loaded config entries."""
+    domain_data: dict[str, Any] = hass.data.get(DOMAIN, {})
+    return [
+        domain_data[entry.entry_id]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED and entry.entry_id in domain_data
+    ]
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> GamerPowerCoordinator:
+    """Return the coordinator a call is routed to.
+
+    Calls name their entry with ``config_entry_id``; without it they go to the
+    first loaded entry, as before entries could be targeted.
+    """
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            raise ServiceValidationError(f"Unknown GamerPower config entry {entry_id}")
+        if entry.state is not ConfigEntryState.LOADED or (
+            coordinator := hass.data.get(DOMAIN, {}).get(entry_id)
+        ) is None:
+            raise ServiceValidationError(f"GamerPower config entry {entry_id} is not loaded")
+        return coordinator
+    if not (coordinators := _loaded_coordinators(hass)):
+        raise ServiceValidationError("No GamerPower config entry is loaded")
+    return coordinators[0]
+
+
+def _page(giveaways: list[Giveaway], page: int, page_size: int) -> dict[str, Any]:
+    """Return one page of giveaways as a service response."""
+    start = (page - 1) * page_size
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total": len(giveaways),
+        "pages": -(-len(giveaways) // page_size),
+        "giveaways": [compact_giveaway(g) for g in giveaways[start : start + page_size]],
+    }
+
+
+async def _async_handle_refresh(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Refresh the given entry, or every entry."""
+    _LOGGER.info("Manually refreshing GamerPower data")
+    if ATTR_CONFIG_ENTRY_ID in call.data:
+        await _get_coordinator(hass, call).async_force_refresh()
+        return
+    for coordinator in _loaded_coordinators(hass):
+        await coordinator.async_force_refresh()
+
+
+async def _async_handle_get_giveaway(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle getting a specific giveaway."""
+    coordinator = _get_coordinator(hass, call)
+    result = await coordinator.async_get_giveaway_details(call.data["giveaway_id"])
+    return result or {}
+
+
+async def _async_handle_get_giveaways(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle getting several giveaways at once."""
+    coordinator = _get_coordinator(hass, call)
+    found, errors = await coordinator.async_get_many_giveaway_details(
+        call.data["giveaway_ids"]
+    )
+    return {
+        "giveaways": {str(gid): details for gid, details in found.items()},
+        "errors": {str(gid): error for gid, error in errors.items()},
+    }
+
+
+async def _async_handle_list_giveaways(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Return one page of the active giveaways of an entry."""
+    coordinator = _get_coordinator(hass, call)
+    giveaways = coordinator.data.giveaways if coordinator.data else []
+    return _page(giveaways, call.data["page"], call.data["page_size"])
+
+
+async def _async_handle_search(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Return one page of the giveaways of an entry matching a combined query."""
+    coordinator = _get_coordinator(hass, call)
+    ends_after = call.data.get("ends_after")
+    ends_before = call.data.get("ends_before")
+    with coordinator.metrics.measure("search"):
+        results = coordinator.index.search(
+            query=call.data.get("query"),
+            platforms=[PLATFORMS[p].lower() for p in call.data["platforms"]],
+            types=[GIVEAWAY_TYPE_LABELS[t] for t in call.data["types"]],
+            min_worth=call.data.get("min_worth"),
+            max_worth=call.data.get("max_worth"),
+            ends_after=dt_util.as_utc(ends_after) if ends_after else None,
+            ends_before=dt_util.as_utc(ends_before) if ends_before else None,
+            sort=call.data["sort"],
+        )
+    return _page(results, call.data["page"], call.data["page_size"])
+
+
+async def _async_handle_query_archive(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Aggregate the archived giveaways, without calling the API.
+
+    The archive is shared by every entry, so any loaded entry's hub answers.
+    """
+    coordinator = _get_coordinator(hass, call)
+    start = call.data.get("start")
+    end = call.data.get("end")
+    return await coordinator.hub.archive.async_query(
+        start=dt_util.as_utc(start) if start else None,
+        end=dt_util.as_utc(end) if end else None,
+        platforms=[PLATFORMS[p] for p in call.data["platforms"]],
+        types=[GIVEAWAY_TYPE_LABELS[t] for t in call.data["types"]],
+        group_by=call.data["group_by"],
+    )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the GamerPower services once for all config entries."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        partial(_async_handle_refresh, hass),
+        schema=vol.Schema(ENTRY_SCHEMA),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_GIVEAWAY,
+        partial(_async_handle_get_giveaway, hass),
+        schema=vol.Schema(
+            {
+                **ENTRY_SCHEMA,
+                vol.Required("giveaway_id"): cv.positive_int,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_GIVEAWAYS,
+        partial(_async_handle_get_giveaways, hass),
+        schema=vol.Schema(
+            {
+                **ENTRY_SCHEMA,
+                vol.Required("giveaway_ids"): vol.All(
+                    cv.ensure_list,
+                    [cv.positive_int],
+                    vol.Length(min=1, max=MAX_BATCH_GIVEAWAYS),
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_GIVEAWAYS,
+        partial(_async_handle_list_giveaways, hass),
+        schema=vol.Schema({**ENTRY_SCHEMA, **PAGE_SCHEMA}),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH,
+        partial(_async_handle_search, hass),
+        schema=vol.Schema(
+            {
+                **ENTRY_SCHEMA,
+                **FILTER_SCHEMA,
+                **PAGE_SCHEMA,
+                vol.Optional("query"): cv.string,
+                vol.Optional("min_worth"): vol.Coerce(float),
+                vol.Optional("max_worth"): vol.Coerce(float),
+                vol.Optional("ends_after"): cv.datetime,
+                vol.Optional("ends_before"): cv.datetime,
+                vol.Optional("sort", default=SORT_NEWEST): vol.In(SORT_OPTIONS),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_ARCHIVE,
+        partial(_async_handle_query_archive, hass),
+        schema=vol.Schema(
+            {
+                **FILTER_SCHEMA,
+                vol.Optional("start"): cv.datetime,
+                vol.Optional("end"): cv.datetime,
+                vol.Optional("group_by", default=GROUP_NONE): vol.In(GROUP_OPTIONS),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,195 @@
+"""Long-term statistics of the giveaway breakdowns."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+
+from .const import DOMAIN, STATISTICS_MAX_GAP_HOURS
+
+if TYPE_CHECKING:
+    from .models import GamerPowerData
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+# Breakdown kinds, part of the statistic ID: (name suffix, unit)
+KIND_PLATFORM_COUNT = "platform"
+KIND_PLATFORM_WORTH = "platform_worth"
+KIND_TYPE_COUNT = "type"
+KIND_TYPE_WORTH = "type_worth"
+KINDS: dict[str, tuple[str, str | None]] = {
+    KIND_PLATFORM_COUNT: ("giveaways", None),
+    KIND_PLATFORM_WORTH: ("worth", "USD"),
+    KIND_TYPE_COUNT: ("giveaways", None),
+    KIND_TYPE_WORTH: ("worth", "USD"),
+}
+
+
+def statistic_id_prefix(entry_id: str) -> str:
+    """Return the prefix shared by the statistic IDs of a config entry."""
+    return f"{DOMAIN}:{entry_id.lower()}_"
+
+
+def breakdown_values(data: GamerPowerData) -> dict[tuple[str, str], float]:
+    """Return the count and worth of a snapshot per platform and per type."""
+    values: dict[tuple[str, str], float] = {}
+    for group in data.platform_groups.values():
+        values[(KIND_PLATFORM_COUNT, group.label)] = group.count
+        values[(KIND_PLATFORM_WORTH, group.label)] = round(group.worth, 2)
+    for group in data.type_groups.values():
+        values[(KIND_TYPE_COUNT, group.label)] = group.count
+        values[(KIND_TYPE_WORTH, group.label)] = round(group.worth, 2)
+    return values
+
+
+class HourlyAggregate:
+    """Mean, min and max of the samples of a series in the current hour."""
+
+    __slots__ = ("hour", "min", "max", "total", "samples", "last")
+
+    def __init__(self, hour: datetime, value: float) -> None:
+        """Start an hour with its first sample."""
+        self.hour = hour
+        self.min = self.max = self.total = self.last = value
+        self.samples = 1
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the hour."""
+        return self.total / self.samples
+
+    def add(self, value: float) -> None:
+        """Add a sample to the hour."""
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.total += value
+        self.samples += 1
+        self.last = value
+
+    def row(self) -> dict[str, Any]:
+        """Return the hour as a statistics row."""
+        return {
+            "start": self.hour,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class GiveawayStatistics:
+    """Push hourly count and worth breakdowns as external statistics.
+
+    Samples are folded in memory into the aggregate of the current hour for
+    each platform and type. A series is only imported when its value changes
+    or when a new hour starts, so unchanged polls cost nothing; charts of the
+    breakdowns then come from the statistics tables instead of attributes.
+    Hours skipped between two samples are filled with the previous value,
+    and a series that disappears from the snapshot is recorded as zero.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, title: str) -> None:
+        """Initialize the statistics of a config entry."""
+        self.hass = hass
+        self.title = title
+        self._prefix = statistic_id_prefix(entry_id)
+        self._series: dict[tuple[str, str], HourlyAggregate] = {}
+        self._hour: datetime | None = None
+
+    def __len__(self) -> int:
+        """Return the number of series tracked."""
+        return len(self._series)
+
+    @callback
+    def async_record(
+        self, data: GamerPowerData, now: datetime, changed: bool = True
+    ) -> None:
+        """Record a snapshot in the hourly statistics.
+
+        An unchanged snapshot is skipped until a new hour starts.
+        """
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if (not changed and hour == self._hour) or (
+            "recorder" not in self.hass.config.components
+        ):
+            return
+        self._hour = hour
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        values = breakdown_values(data)
+        for key in self._series.keys() - values.keys():
+            values[key] = 0.0
+
+        for key, value in values.items():
+            if not (rows := self._sample(key, hour, value)):
+                continue
+            kind, label = key
+            suffix, unit = KINDS[kind]
+            async_add_external_statistics(
+                self.hass,
+                {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": f"{self.title} {label} {suffix}",
+                    "source": DOMAIN,
+                    "statistic_id": f"{self._prefix}{kind}_{slugify(label)}",
+                    "unit_of_measurement": unit,
+                },
+                rows,
+            )
+
+    def _sample(
+        self,
+        key: tuple[str, str],
+        hour: datetime,
+        value: float,
+    ) -> list[dict[str, Any]]:
+        """Fold a sample into its series and return the rows to import.
+
+        Within an hour, only a changed value is sampled and re-imported.
+        """
+        if (aggregate := self._series.get(key)) is None:
+            self._series[key] = aggregate = HourlyAggregate(hour, value)
+            return [aggregate.row()]
+        if aggregate.hour == hour:
+            if value == aggregate.last:
+                return []
+            aggregate.add(value)
+            return [aggregate.row()]
+
+        # Carry the last value over the hours without an update
+        rows: list[dict[str, Any]] = []
+        last = aggregate.last
+        gap_start = max(aggregate.hour + HOUR, hour - STATISTICS_MAX_GAP_HOURS * HOUR)
+        while gap_start < hour:
+            rows.append({"start": gap_start, "mean": last, "min": last, "max": last})
+            gap_start += HOUR
+        self._series[key] = aggregate = HourlyAggregate(hour, value)
+        rows.append(aggregate.row())
+        return rows
+
+
+async def async_clear_statistics(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the statistics of a removed config entry."""
+    if "recorder" not in hass.config.components:
+        return
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.statistics import async_list_statistic_ids
+
+    prefix = statistic_id_prefix(entry_id)
+    statistic_ids = [
+        metadata["statistic_id"]
+        for metadata in await async_list_statistic_ids(hass)
+        if metadata["statistic_id"].startswith(prefix)
+    ]
+    if statistic_ids:
+        _LOGGER.debug("Clearing %s GamerPower statistics", len(statistic_ids))
+        get_instance(hass).async_clear_statistics(statistic_ids)
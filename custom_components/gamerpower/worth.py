@@ -0,0 +1,15 @@
+"""Local worth estimation for GamerPower giveaways."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def parse_worth(value: str | None) -> float | None:
+    """Parse a worth string like "$1,234.56" or "N/A" into a float."""
+    if not value:
+        return None
+    try:
+        return float(value.replace("$", "").replace(",", "").replace("~", ""))
+    except ValueError:
+        return None